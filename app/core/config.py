@@ -55,9 +55,11 @@ class Settings(BaseSettings):
     llm_classifier_max_tokens: int = 256
     llm_classifier_timeout_sec: float = 8.0
     llm_classifier_cache_ttl_seconds: int = 60 * 60 * 24 * 7
+    llm_classifier_negative_cache_ttl_seconds: int = 60 * 5
     llm_classifier_confidence_threshold: float = 0.7
     llm_classifier_enabled: bool = True
     llm_classifier_l1_cache_size: int = 256
+    llm_classifier_inflight_timeout_sec: float = 20.0
 
     llm_tips_enabled: bool = True
     llm_tips_model: str | None = None
@@ -5,7 +5,10 @@ from app.core.config import settings
 
 
 engine = create_engine(
-    settings.sqlalchemy_url, pool_pre_ping=True, pool_recycle=3600, future=True
+    settings.sqlalchemy_url,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    future=True,
 )
 SessionLocal = sessionmaker(
     bind=engine, autocommit=False, autoflush=False, future=True
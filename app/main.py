@@ -1,6 +1,7 @@
 import logging
 
 from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.responses import JSONResponse
 
@@ -9,7 +10,7 @@ from app.core.config import settings
 
 def create_app() -> FastAPI:
     logging.basicConfig(level=logging.INFO)
-    app = FastAPI(title=settings.app_name)
+    app = FastAPI(title=settings.app_name, default_response_class=ORJSONResponse)
     # CORS
     # "*"일 때는 allow_credentials를 False로 설정 (FastAPI 제약)
     cors_origins = settings.cors_origins
@@ -114,14 +114,6 @@ def _common_conditions(response: RuleEngineResponse) -> dict:
     return response.conditions.get("common", {})
 
 
-def _carry_status(response: RuleEngineResponse) -> str:
-    return response.decision.carry_on.status
-
-
-def _checked_status(response: RuleEngineResponse) -> str:
-    return response.decision.checked.status
-
-
 def _has_badge(badges: Iterable[str], keyword: str) -> bool:
     keyword = keyword.lower()
     return any(keyword in badge.lower() for badge in badges)
@@ -134,12 +126,20 @@ def _max_container_limit(response: RuleEngineResponse) -> int | None:
     return _common_conditions(response).get("max_container_ml")
 
 
+_SPLIT_VOLUME_TMPL = "{ml}ml 이하 빈 용기에 소분하면 기내 반입이 가능합니다.".format
+_SPLIT_VOLUME_DEFAULT_TEXT = "100ml 이하 빈 용기에 나눠 담으면 기내로 가져갈 수 있어요."
+_CARRY_LIMIT_TMPL = "기내 한도({limits})를 넘지 않게 짐을 나눠 담으세요.".format
+_ZIP_BAG_TEXT = "액체는 1L 투명 지퍼백에 넣어 보안대에서 한 번에 꺼내세요."
+_AEROSOL_TEXT = "스프레이 버튼과 노즐은 캡을 씌워 충격이나 오작동을 막아주세요."
+_BATTERY_TEXT = "스페어 배터리는 단자를 절연해 기내 휴대로만 보관하세요."
+
+
 def _split_volume_text(request: RuleEngineRequest, response: RuleEngineResponse) -> str:
     volume = request.item_params.volume_ml
     max_ml = _max_container_limit(response)
     if volume and max_ml:
-        return f"{max_ml}ml 이하 빈 용기에 소분하면 기내 반입이 가능합니다."
-    return "100ml 이하 빈 용기에 나눠 담으면 기내로 가져갈 수 있어요."
+        return _SPLIT_VOLUME_TMPL(ml=max_ml)
+    return _SPLIT_VOLUME_DEFAULT_TEXT
 
 
 def _carry_limit_text(_req: RuleEngineRequest, response: RuleEngineResponse) -> str:
@@ -152,16 +152,19 @@ def _carry_limit_text(_req: RuleEngineRequest, response: RuleEngineResponse) ->
         parts.append(weight)
     if size:
         parts.append(size)
-    joined = " · ".join(parts)
-    return f"기내 한도({joined})를 넘지 않게 짐을 나눠 담으세요."
+    return _CARRY_LIMIT_TMPL(limits=" · ".join(parts))
+
+
+def _zip_bag_text(_req: RuleEngineRequest, _response: RuleEngineResponse) -> str:
+    return _ZIP_BAG_TEXT
 
 
 def _aerosol_text(_req: RuleEngineRequest, _response: RuleEngineResponse) -> str:
-    return "스프레이 버튼과 노즐은 캡을 씌워 충격이나 오작동을 막아주세요."
+    return _AEROSOL_TEXT
 
 
 def _battery_text(_req: RuleEngineRequest, _response: RuleEngineResponse) -> str:
-    return "스페어 배터리는 단자를 절연해 기내 휴대로만 보관하세요."
+    return _BATTERY_TEXT
 
 
 def _is_liquid_item(canonical: str) -> bool:
@@ -172,55 +175,75 @@ def _is_aerosol_item(canonical: str) -> bool:
     return canonical.startswith("aerosol")
 
 
+def _pred_split_100ml(request: RuleEngineRequest, response: RuleEngineResponse) -> bool:
+    return (
+        _is_liquid_item(request.canonical)
+        and _max_container_limit(response) == 100
+        and (request.item_params.volume_ml or 0) > 100
+    )
+
+
+def _pred_zip_bag(request: RuleEngineRequest, response: RuleEngineResponse) -> bool:
+    return (
+        _is_liquid_item(request.canonical)
+        and _max_container_limit(response) == 100
+        and bool(_carry_conditions(response).get("zip_bag_1l"))
+    )
+
+
+def _pred_carry_limit(_req: RuleEngineRequest, response: RuleEngineResponse) -> bool:
+    carry_on = response.decision.carry_on
+    if carry_on.status == "deny":
+        return False
+    badges = carry_on.badges
+    return _has_badge(badges, "kg") or _has_badge(badges, "pc") or _has_badge(badges, "cm")
+
+
+def _pred_aerosol_cap(request: RuleEngineRequest, response: RuleEngineResponse) -> bool:
+    if not _is_aerosol_item(request.canonical):
+        return False
+    decision = response.decision
+    return decision.carry_on.status in {"allow", "limit"} or decision.checked.status in {"allow", "limit"}
+
+
+def _pred_lithium_spare(request: RuleEngineRequest, response: RuleEngineResponse) -> bool:
+    return request.canonical in BATTERY_SPARE_KEYS and response.decision.carry_on.status != "deny"
+
+
 TIP_RULES: tuple[TipRule, ...] = (
     TipRule(
         id="tip.split_100ml",
         tags=("액체류", "소분"),
         relevance=0.96,
-        predicate=lambda req, resp: _is_liquid_item(req.canonical)
-        and _max_container_limit(resp) == 100
-        and (req.item_params.volume_ml or 0) > 100,
+        predicate=_pred_split_100ml,
         builder=_split_volume_text,
     ),
     TipRule(
         id="tip.zip_bag",
         tags=("보안절차",),
         relevance=0.9,
-        predicate=lambda req, resp: _is_liquid_item(req.canonical)
-        and _max_container_limit(resp) == 100
-        and bool(_carry_conditions(resp).get("zip_bag_1l")),
-        builder=lambda _req, _resp: "액체는 1L 투명 지퍼백에 넣어 보안대에서 한 번에 꺼내세요.",
+        predicate=_pred_zip_bag,
+        builder=_zip_bag_text,
     ),
     TipRule(
         id="tip.carry_limit",
         tags=("기내한도",),
         relevance=0.82,
-        predicate=lambda _req, resp: _carry_status(resp) != "deny"
-        and (
-            _has_badge(resp.decision.carry_on.badges, "kg")
-            or _has_badge(resp.decision.carry_on.badges, "pc")
-            or _has_badge(resp.decision.carry_on.badges, "cm")
-        ),
+        predicate=_pred_carry_limit,
         builder=_carry_limit_text,
     ),
     TipRule(
         id="tip.aerosol_cap",
         tags=("에어로졸", "안전"),
         relevance=0.78,
-        predicate=lambda req, resp: _is_aerosol_item(req.canonical)
-        and any(
-            status in {"allow", "limit"}
-            for status in (_carry_status(resp), _checked_status(resp))
-        ),
+        predicate=_pred_aerosol_cap,
         builder=_aerosol_text,
     ),
     TipRule(
         id="tip.lithium_spare",
         tags=("배터리", "기내"),
         relevance=0.76,
-        predicate=lambda req, resp: req.canonical in BATTERY_SPARE_KEYS
-        and _carry_status(resp) != "deny",
+        predicate=_pred_lithium_spare,
         builder=_battery_text,
     ),
 )
-
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import asdict, dataclass
-from functools import lru_cache
-from typing import Dict, Iterable, Iterator, List, Sequence
-
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence
+
+import orjson
 import requests
 import sqlalchemy as sa
-from airportsdata import load as load_airportsdata
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from redis.exceptions import RedisError
-from sqlalchemy import delete, insert, select
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from app.core.cache import cached_json, get_redis
@@ -17,6 +26,7 @@ from app.core.config import settings
 from app.db.models.airport import Airport
 from app.db.models.country import Country
 from app.db.models.regulation import RuleSet
+from app.services.airports_data import AIRPORTS_IATA
 
 
 logger = logging.getLogger(__name__)
@@ -24,33 +34,28 @@ logger = logging.getLogger(__name__)
 COUNTRY_CACHE_KEY = "ref:countries:v1"
 AIRPORT_CACHE_KEY = "ref:airports:v1"
 AIRPORT_INDEX_CACHE_KEY = "ref:airports:index:v1"
+COUNTRY_SEARCH_CACHE_KEY = "ref:countries:search:v2"
+AIRPORT_SEARCH_CACHE_KEY = "ref:airports:search:v3"
+ACTIVE_COUNTRIES_CACHE_KEY = "ref:active_countries:v1"
 DIRECTORY_VERSION_KEY = "ref:directory:version"
 CACHE_TTL_SECONDS = 60 * 60 * 6  # 6 hours
+LOCAL_CACHE_TTL_SECONDS = 30
+LOCAL_VERSION_CHECK_INTERVAL = 1.0
+COUNTRY_SEARCH_FIELDS = ("code", "name_en", "name_ko")
+AIRPORT_SEARCH_FIELDS = ("iata_code", "icao_code", "name_en", "name_ko", "city_en", "city_ko")
+PAGE_FETCH_WORKERS = 8
+INSERT_BATCH_SIZE = 5000
+_SUPPORTED_COUNTRIES: frozenset[str] = frozenset(code.upper() for code in settings.supported_countries)
+SQL_SEARCH_MIN_QUERY_LENGTH = 3
 
 
-class AirportDirectoryError(RuntimeError):
-    """Raised when the airport directory cannot be fetched or persisted."""
+_LOCAL_CACHE: TTLCache = TTLCache(maxsize=32, ttl=LOCAL_CACHE_TTL_SECONDS)
+_LOCAL_CACHE_LOCK = threading.Lock()
+_LOCAL_VERSION: Dict[str, Any] = {"value": None, "checked_at": 0.0}
 
 
-@dataclass(slots=True)
-class NormalizedCountry:
-    code: str
-    name_en: str
-    name_ko: str
-    region_group: str | None = None
-    iso3_code: str | None = None
-
-
-@dataclass(slots=True)
-class NormalizedAirport:
-    iata_code: str
-    icao_code: str | None
-    name_en: str
-    name_ko: str | None
-    city_en: str | None
-    city_ko: str | None
-    region_group: str | None
-    country_code: str
+class AirportDirectoryError(RuntimeError):
+    """Raised when the airport directory cannot be fetched or persisted."""
 
 
 @dataclass(slots=True)
@@ -60,6 +65,26 @@ class SyncResult:
     skipped_airports: int
 
 
+def _build_molit_session() -> requests.Session:
+    session = requests.Session()
+    # 병렬 페이지 조회가 커넥션을 재사용하도록 풀 크기를 워커 수 이상으로 맞춘다.
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
 class MolitAirportClient:
     """Thin wrapper around 국토교통부 공항 데이터 API."""
 
@@ -75,7 +100,8 @@ class MolitAirportClient:
         self.base_url = (base_url or settings.molit_airport_base_url).rstrip("/")
         self.dataset_id = dataset_id or settings.molit_airport_dataset_id
         self.timeout = timeout
-        self.session = session or requests.Session()
+        # 호출자가 넘긴 세션의 어댑터/헤더 설정은 건드리지 않는다.
+        self.session = session or _build_molit_session()
 
         if not self.api_key:
             raise AirportDirectoryError("MOLIT service key is not configured.")
@@ -83,25 +109,45 @@ class MolitAirportClient:
             raise AirportDirectoryError("MOLIT dataset id is not configured.")
 
     def iter_rows(self, per_page: int = 1000) -> Iterator[dict]:
+        first = self._fetch_page(page=1, per_page=per_page)
+        data = first.get("data") or []
+        logger.debug("Fetched %s rows for page %s", len(data), 1)
+        if not data:
+            return
+        yield from data
+
+        total = first.get("totalCount")
+        if total is None:
+            yield from self._iter_remaining_sequential(per_page, len(data))
+            return
+
+        last_page = math.ceil(total / per_page)
+        if last_page <= 1:
+            return
+        pages = range(2, last_page + 1)
+        executor = ThreadPoolExecutor(max_workers=min(PAGE_FETCH_WORKERS, len(pages)))
+        try:
+            futures = {page: executor.submit(self._fetch_page, page, per_page) for page in pages}
+            # 페이지 순서대로 결과를 돌려주되, 나머지 페이지는 병렬로 받아 둔다.
+            for page in pages:
+                data = futures[page].result().get("data") or []
+                logger.debug("Fetched %s rows for page %s", len(data), page)
+                yield from data
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _iter_remaining_sequential(self, per_page: int, last_count: int) -> Iterator[dict]:
+        """totalCount가 없을 때는 빈/부분 페이지를 만날 때까지 순차 조회한다."""
         page = 1
-        total = None
-        while True:
+        while last_count >= per_page:
+            page += 1
             payload = self._fetch_page(page=page, per_page=per_page)
             data = payload.get("data") or []
             logger.debug("Fetched %s rows for page %s", len(data), page)
             if not data:
                 break
             yield from data
-
-            total = payload.get("totalCount") or total
-            current = payload.get("currentCount") or len(data)
-            if total is None:
-                if len(data) < per_page:
-                    break
-            else:
-                if page * per_page >= total or current == 0:
-                    break
-            page += 1
+            last_count = payload.get("currentCount") or len(data)
 
     def _fetch_page(self, page: int, per_page: int) -> dict:
         url = f"{self.base_url}/{self.dataset_id}"
@@ -116,7 +162,8 @@ class MolitAirportClient:
             raise AirportDirectoryError(
                 f"MOLIT API 호출 실패 (status={response.status_code}, body={response.text[:200]})"
             )
-        return response.json()
+        # 본문 bytes를 바로 파싱해 response.json()의 str 디코딩 사본을 만들지 않는다.
+        return orjson.loads(response.content)
 
 
 class AirportDirectorySynchronizer:
@@ -138,8 +185,9 @@ class AirportDirectorySynchronizer:
         )
 
     def _normalize(self, rows: Sequence[dict]) -> dict:
-        countries: Dict[str, NormalizedCountry] = {}
-        airports: Dict[str, NormalizedAirport] = {}
+        # 값은 countries/airports 테이블 컬럼명을 키로 하는 insert용 dict이다.
+        countries: Dict[str, dict] = {}
+        airports: Dict[str, dict] = {}
         skipped = 0
 
         for raw in rows:
@@ -162,161 +210,169 @@ class AirportDirectorySynchronizer:
             korean_country = _clean(raw.get("한글국가명"))
             english_country = _clean(raw.get("영문국가명")) or country_code
 
-            if country_code not in countries:
-                countries[country_code] = NormalizedCountry(
-                    code=country_code,
-                    name_en=english_country,
-                    name_ko=korean_country or english_country,
-                    region_group=region,
-                )
+            existing = countries.get(country_code)
+            if existing is None:
+                countries[country_code] = {
+                    "code": country_code,
+                    "name_en": english_country,
+                    "name_ko": korean_country or english_country,
+                    "region_group": region,
+                    "iso3_code": None,
+                }
             else:
-                existing = countries[country_code]
-                if not existing.region_group and region:
-                    existing.region_group = region
-                if not existing.name_ko and korean_country:
-                    existing.name_ko = korean_country
-
-            airports[iata] = NormalizedAirport(
-                iata_code=iata,
-                icao_code=_clean(raw.get("공항코드2(ICAO)")) or None,
-                name_en=english_name,
-                name_ko=hangul_name or None,
-                city_en=city_en or None,
-                city_ko=None,
-                region_group=region,
-                country_code=country_code,
-            )
+                if not existing["region_group"] and region:
+                    existing["region_group"] = region
+                if not existing["name_ko"] and korean_country:
+                    existing["name_ko"] = korean_country
+
+            airports[iata] = {
+                "iata_code": iata,
+                "icao_code": _clean(raw.get("공항코드2(ICAO)")) or None,
+                "name_en": english_name,
+                "name_ko": hangul_name or None,
+                "city_en": city_en or None,
+                "city_ko": None,
+                "region_group": region,
+                "country_code": country_code,
+            }
 
         return {"countries": countries, "airports": airports, "skipped": skipped}
 
     def _replace_tables(
         self,
-        countries: Dict[str, NormalizedCountry],
-        airports: Dict[str, NormalizedAirport],
+        countries: Dict[str, dict],
+        airports: Dict[str, dict],
     ) -> None:
         logger.info("국가 %s개, 공항 %s개의 디렉터리를 재적재합니다.", len(countries), len(airports))
-        self.db.execute(delete(Airport))
-        self.db.execute(delete(Country))
+        # 전체 DELETE 후 재적재 대신 upsert하고, 목록에서 빠진 행만 지운다.
         if countries:
-            payload = [asdict(c) for c in countries.values()]
-            self.db.execute(insert(Country), payload)
+            self._bulk_upsert(Country, list(countries.values()), key="code")
         if airports:
-            payload = [asdict(a) for a in airports.values()]
-            self.db.execute(insert(Airport), payload)
+            self._bulk_upsert(Airport, list(airports.values()), key="iata_code")
+        self.db.execute(delete(Airport).where(Airport.iata_code.not_in(list(airports))))
+        self.db.execute(delete(Country).where(Country.code.not_in(list(countries))))
         self.db.commit()
 
+    def _bulk_upsert(self, model: type, payload: Sequence[dict], key: str) -> None:
+        dialect = self.db.get_bind().dialect.name
+        update_columns = [column for column in payload[0] if column != key]
+        if dialect == "mysql":
+            stmt = mysql_insert(model)
+            stmt = stmt.on_duplicate_key_update({column: stmt.inserted[column] for column in update_columns})
+        elif dialect in ("postgresql", "sqlite"):
+            dialect_insert = postgresql_insert if dialect == "postgresql" else sqlite_insert
+            stmt = dialect_insert(model)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[key],
+                set_={column: stmt.excluded[column] for column in update_columns},
+            )
+        else:
+            raise AirportDirectoryError(f"Unsupported dialect for directory upsert: {dialect}")
+        # max_allowed_packet을 넘지 않도록 배치 단위로 executemany를 보낸다.
+        for start in range(0, len(payload), INSERT_BATCH_SIZE):
+            self.db.execute(stmt, payload[start : start + INSERT_BATCH_SIZE])
+
 
 class CountryDirectoryService:
     def __init__(self, db: Session) -> None:
         self.db = db
+        self._active_codes_cache: set[str] | None = None
 
     def _get_active_country_codes(self) -> set[str]:
-        """DB에 규정이 있는 서비스 중인 국가 코드 목록을 반환합니다."""
-        rows = self.db.scalars(
-            select(RuleSet.code).where(RuleSet.scope == "country")
-        ).all()
-        # code에서 국가 코드 부분만 추출 (예: "US_DG" -> "US", "KR" -> "KR")
-        db_codes = set()
-        for code in rows:
-            code_upper = code.upper()
-            # 언더스코어로 분리하여 첫 번째 부분을 국가 코드로 사용
-            country_code = code_upper.split("_")[0]
-            db_codes.add(country_code)
-        # 설정에 명시된 서비스 중인 국가만 필터링
-        supported = {code.upper() for code in settings.supported_countries}
-        return db_codes & supported
+        if self._active_codes_cache is None:
+            self._active_codes_cache = _active_country_codes(self.db)
+        return self._active_codes_cache
 
-    def list(self, active_only: bool = True) -> List[dict]:
+    def _cached_list(self, active_only: bool) -> List[dict]:
         def loader() -> List[dict]:
-            query = select(Country).order_by(Country.name_en)
+            query = select(
+                Country.code,
+                Country.name_en,
+                Country.name_ko,
+                Country.region_group,
+            ).order_by(Country.name_en)
             if active_only:
                 active_codes = self._get_active_country_codes()
                 if active_codes:
                     query = query.where(Country.code.in_(active_codes))
-            rows = self.db.scalars(query).all()
-            return [
-                {
-                    "code": row.code,
-                    "name_en": row.name_en,
-                    "name_ko": row.name_ko,
-                    "region_group": row.region_group,
-                }
-                for row in rows
-            ]
+            return [dict(row._mapping) for row in self.db.execute(query)]
 
         cache_key = f"{COUNTRY_CACHE_KEY}:active" if active_only else COUNTRY_CACHE_KEY
-        return cached_json(cache_key, CACHE_TTL_SECONDS, loader)
+        return _local_cached_json(cache_key, loader)
+
+    def list(self, active_only: bool = True) -> List[dict]:
+        return [dict(record) for record in self._cached_list(active_only)]
 
     def search(self, q: str | None = None, region: str | None = None, active_only: bool = True) -> List[dict]:
-        records = self.list(active_only=active_only)
+        index = self._cached_search_index(active_only)
         q_lower = q.lower().strip() if q else None
         region_lower = region.lower().strip() if region else None
+        return _search_index(index, q_lower, "region_group", region_lower)
 
-        def match(record: dict) -> bool:
-            if region_lower and (record.get("region_group") or "").lower() != region_lower:
-                return False
-            if not q_lower:
-                return True
-            return (
-                q_lower in record["code"].lower()
-                or q_lower in (record.get("name_en") or "").lower()
-                or q_lower in (record.get("name_ko") or "").lower()
+    def _cached_search_index(self, active_only: bool) -> dict:
+        def loader() -> dict:
+            return _build_search_index(
+                self._cached_list(active_only), COUNTRY_SEARCH_FIELDS, ("region_group",)
             )
 
-        return [record for record in records if match(record)]
+        cache_key = f"{COUNTRY_SEARCH_CACHE_KEY}:active" if active_only else COUNTRY_SEARCH_CACHE_KEY
+        return _local_cached_json(cache_key, loader)
 
 
 class AirportDirectoryService:
     def __init__(self, db: Session) -> None:
         self.db = db
+        self._active_codes_cache: set[str] | None = None
 
     def _get_active_country_codes(self) -> set[str]:
-        """DB에 규정이 있고 서비스 중인 국가 코드 목록을 반환합니다."""
-        rows = self.db.scalars(
-            select(RuleSet.code).where(RuleSet.scope == "country")
-        ).all()
-        # code에서 국가 코드 부분만 추출 (예: "US_DG" -> "US", "KR" -> "KR")
-        db_codes = set()
-        for code in rows:
-            code_upper = code.upper()
-            # 언더스코어로 분리하여 첫 번째 부분을 국가 코드로 사용
-            country_code = code_upper.split("_")[0]
-            db_codes.add(country_code)
-        # 설정에 명시된 서비스 중인 국가만 필터링
-        supported = {code.upper() for code in settings.supported_countries}
-        return db_codes & supported
+        if self._active_codes_cache is None:
+            self._active_codes_cache = _active_country_codes(self.db)
+        return self._active_codes_cache
 
-    def list(self, active_only: bool = True) -> List[dict]:
+    def _cached_list(self, active_only: bool) -> List[dict]:
         def loader() -> List[dict]:
-            query = select(Airport).order_by(Airport.name_en)
+            query = select(*_AIRPORT_COLUMNS).order_by(Airport.name_en)
             if active_only:
                 active_codes = self._get_active_country_codes()
                 if active_codes:
                     query = query.where(Airport.country_code.in_(active_codes))
-            rows = self.db.scalars(query).all()
-            return [
-                {
-                    "iata_code": row.iata_code,
-                    "icao_code": row.icao_code,
-                    "name_en": row.name_en,
-                    "name_ko": row.name_ko,
-                    "city_en": row.city_en,
-                    "city_ko": row.city_ko,
-                    "country_code": row.country_code,
-                    "region_group": row.region_group,
-                }
-                for row in rows
-            ]
+            return [dict(row._mapping) for row in self.db.execute(query)]
 
         cache_key = f"{AIRPORT_CACHE_KEY}:active" if active_only else AIRPORT_CACHE_KEY
-        return cached_json(cache_key, CACHE_TTL_SECONDS, loader)
+        return _local_cached_json(cache_key, loader)
+
+    def list(self, active_only: bool = True) -> List[dict]:
+        return [dict(record) for record in self._cached_list(active_only)]
 
     def as_index(self) -> Dict[str, dict]:
         def loader() -> Dict[str, dict]:
-            items = self.list()
-            return {item["iata_code"]: item for item in items}
-
-        return cached_json(AIRPORT_INDEX_CACHE_KEY, CACHE_TTL_SECONDS, loader)
+            dialect = self.db.get_bind().dialect.name
+            if dialect in ("mysql", "postgresql"):
+                return self._index_from_db(dialect)
+            return {item["iata_code"]: item for item in self._cached_list(active_only=True)}
+
+        index = _local_cached_json(AIRPORT_INDEX_CACHE_KEY, loader)
+        return {code: dict(record) for code, record in index.items()}
+
+    def _index_from_db(self, dialect: str) -> Dict[str, dict]:
+        """IATA 코드 → 공항 정보 인덱스를 DB의 JSON 집계 함수로 한 번에 만든다."""
+        if dialect == "postgresql":
+            object_agg, build_object = sa.func.jsonb_object_agg, sa.func.jsonb_build_object
+        else:
+            object_agg, build_object = sa.func.json_objectagg, sa.func.json_object
+        fields = []
+        for column in _AIRPORT_COLUMNS:
+            fields.extend((sa.literal(column.key), column))
+        query = select(object_agg(Airport.iata_code, build_object(*fields)))
+        active_codes = self._get_active_country_codes()
+        if active_codes:
+            query = query.where(Airport.country_code.in_(active_codes))
+        value = self.db.scalar(query)
+        if value is None:
+            return {}
+        if isinstance(value, (str, bytes)):
+            value = orjson.loads(value)
+        return value
 
     def search(
         self,
@@ -325,58 +381,233 @@ class AirportDirectoryService:
         limit: int | None = None,
         active_only: bool = True,
     ) -> List[dict]:
-        records = self.list(active_only=active_only)
         q_lower = q.lower().strip() if q else None
         country_lower = country_code.lower().strip() if country_code else None
+        if country_lower and q_lower and len(q_lower) >= SQL_SEARCH_MIN_QUERY_LENGTH:
+            return self._search_sql(q_lower, country_lower, limit, active_only)
+        index = self._cached_search_index(active_only)
+        return _search_index(index, q_lower, "country_code", country_lower, limit)
 
-        def match(record: dict) -> bool:
-            if country_lower and record["country_code"].lower() != country_lower:
-                return False
-            if not q_lower:
-                return True
-            fields = (
-                record["iata_code"],
-                record.get("icao_code") or "",
-                record.get("name_en") or "",
-                record.get("name_ko") or "",
-                record.get("city_en") or "",
-                record.get("city_ko") or "",
+    def _search_sql(
+        self,
+        q_lower: str,
+        country_lower: str,
+        limit: int | None,
+        active_only: bool,
+    ) -> List[dict]:
+        """국가+검색어가 모두 주어진 좁은 검색은 캐시된 전체 목록 대신 DB에서 바로 거른다."""
+        country = country_lower.upper()
+        if active_only:
+            active_codes = self._get_active_country_codes()
+            if active_codes and country not in active_codes:
+                return []
+        query = (
+            select(*_AIRPORT_COLUMNS)
+            .where(
+                Airport.country_code == country,
+                sa.or_(*(column.icontains(q_lower, autoescape=True) for column in _AIRPORT_SEARCH_COLUMNS)),
             )
-            return any(q_lower in (field or "").lower() for field in fields)
-
-        filtered = [record for record in records if match(record)]
+            .order_by(Airport.name_en)
+        )
         if limit is not None:
-            return filtered[: max(0, limit)]
-        return filtered
+            query = query.limit(max(0, limit))
+        return [dict(row._mapping) for row in self.db.execute(query)]
+
+    def _cached_search_index(self, active_only: bool) -> dict:
+        def loader() -> dict:
+            return _build_search_index(
+                self._cached_list(active_only), AIRPORT_SEARCH_FIELDS, ("country_code",)
+            )
+
+        cache_key = f"{AIRPORT_SEARCH_CACHE_KEY}:active" if active_only else AIRPORT_SEARCH_CACHE_KEY
+        return _local_cached_json(cache_key, loader)
+
+
+_AIRPORT_COLUMNS = (
+    Airport.iata_code,
+    Airport.icao_code,
+    Airport.name_en,
+    Airport.name_ko,
+    Airport.city_en,
+    Airport.city_ko,
+    Airport.country_code,
+    Airport.region_group,
+)
+_AIRPORT_SEARCH_COLUMNS = tuple(getattr(Airport, field) for field in AIRPORT_SEARCH_FIELDS)
+
+
+def _bigrams(text: str) -> set[str]:
+    return {text[i : i + 2] for i in range(len(text) - 1)}
+
+
+def _build_search_index(records: List[dict], fields: Sequence[str], bucket_fields: Sequence[str]) -> dict:
+    """검색용 인덱스: 소문자 bigram → 레코드 위치, 필터 필드(국가/지역) 값별 버킷 → 레코드 위치.
+
+    `lowered`는 레코드별 검색 필드를 미리 소문자로 바꿔 둔 것으로, API 응답에는 포함되지 않는다.
+    """
+    grams: Dict[str, List[int]] = {}
+    buckets: Dict[str, Dict[str, List[int]]] = {field: {} for field in bucket_fields}
+    lowered: List[List[str]] = []
+    for pos, record in enumerate(records):
+        record_lowered = [(record.get(field) or "").lower() for field in fields]
+        lowered.append(record_lowered)
+        record_grams: set[str] = set()
+        for text in record_lowered:
+            record_grams |= _bigrams(text)
+        for gram in record_grams:
+            grams.setdefault(gram, []).append(pos)
+        for field, bucket in buckets.items():
+            bucket.setdefault((record.get(field) or "").lower(), []).append(pos)
+    return {"records": records, "lowered": lowered, "grams": grams, "buckets": buckets}
+
+
+def _search_index(
+    index: dict,
+    q_lower: str | None,
+    bucket_field: str | None = None,
+    bucket_value: str | None = None,
+    limit: int | None = None,
+) -> List[dict]:
+    if limit is not None:
+        limit = max(0, limit)
+        if limit == 0:
+            return []
+    records: List[dict] = index["records"]
+    lowered: List[List[str]] = index["lowered"]
+
+    # 필터 버킷과 검색어 bigram posting 중 가장 작은 목록부터 교집합을 구한다.
+    postings: List[List[int]] = []
+    if bucket_field and bucket_value:
+        postings.append(index["buckets"][bucket_field].get(bucket_value, []))
+    if q_lower and len(q_lower) >= 2:
+        postings.extend(index["grams"].get(gram, []) for gram in _bigrams(q_lower))
+
+    candidates: Iterable[int]
+    if not postings:
+        candidates = range(len(records))
+    elif len(postings) == 1:
+        candidates = postings[0]
+    else:
+        postings.sort(key=len)
+        narrowed = set(postings[0])
+        for posting in postings[1:]:
+            if not narrowed:
+                break
+            narrowed.intersection_update(posting)
+        candidates = sorted(narrowed)
+
+    results: List[dict] = []
+    for pos in candidates:
+        if q_lower and not any(q_lower in text for text in lowered[pos]):
+            continue
+        # 캐시된 레코드를 호출자가 바꾸지 못하도록 사본을 돌려준다.
+        results.append(dict(records[pos]))
+        if limit is not None and len(results) >= limit:
+            break
+    return results
 
 
 def resolve_country_code(iata_code: str, english_country_name: str | None) -> str | None:
-    info = _airportsdata_index().get(iata_code)
-    if info:
-        candidate = info.get("iso_country") or info.get("country")
-        if candidate:
-            return candidate.upper()
+    iso = _IATA_TO_ISO.get(iata_code)
+    if iso:
+        return iso
     if english_country_name:
-        candidate = COUNTRY_NAME_OVERRIDES.get(english_country_name.strip().lower())
-        if candidate:
-            return candidate
+        return COUNTRY_NAME_OVERRIDES.get(english_country_name.strip().lower())
     return None
 
 
+def _local_cached_json(key: str, loader: Callable[[], Any]) -> Any:
+    """Redis(`cached_json`) 앞단의 짧은 TTL 프로세스 캐시.
+
+    항목마다 디렉터리 버전을 함께 저장해, 다른 프로세스가 캐시를 무효화하면 TTL을 기다리지 않고 다시 읽는다.
+    반환값은 캐시와 공유되므로 호출자는 수정하지 말고 필요하면 사본을 만든다.
+    """
+    version = _directory_version()
+    with _LOCAL_CACHE_LOCK:
+        entry = _LOCAL_CACHE.get(key)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+    value = cached_json(key, CACHE_TTL_SECONDS, loader)
+    if value is not None:
+        with _LOCAL_CACHE_LOCK:
+            _LOCAL_CACHE[key] = (version, value)
+    return value
+
+
+def read_directory_version() -> str:
+    """Redis에 기록된 디렉터리 버전을 읽는다. Redis가 없으면 "0"."""
+    try:
+        return get_redis().get(DIRECTORY_VERSION_KEY) or "0"
+    except Exception:  # pragma: no cover - Redis가 없을 때
+        return "0"
+
+
+def _directory_version() -> str:
+    """LOCAL_VERSION_CHECK_INTERVAL 동안은 마지막으로 읽은 디렉터리 버전을 재사용한다."""
+    now = time.monotonic()
+    with _LOCAL_CACHE_LOCK:
+        cached = _LOCAL_VERSION["value"]
+        if cached is not None and now - _LOCAL_VERSION["checked_at"] < LOCAL_VERSION_CHECK_INTERVAL:
+            return cached
+    version = read_directory_version()
+    with _LOCAL_CACHE_LOCK:
+        _LOCAL_VERSION["value"] = version
+        _LOCAL_VERSION["checked_at"] = now
+    return version
+
+
+def clear_local_directory_cache() -> None:
+    with _LOCAL_CACHE_LOCK:
+        _LOCAL_CACHE.clear()
+        _LOCAL_VERSION["value"] = None
+
+
+def _active_country_codes(db: Session) -> set[str]:
+    """DB에 규정이 있고 서비스 중인 국가 코드 목록을 반환합니다."""
+
+    def loader() -> List[str]:
+        rows = db.scalars(select(RuleSet.code).where(RuleSet.scope == "country")).all()
+        # code에서 국가 코드 부분만 추출 (예: "US_DG" -> "US", "KR" -> "KR")
+        # 설정에 명시된 서비스 중인 국가만 필터링
+        return sorted({code.upper().split("_", 1)[0] for code in rows} & _SUPPORTED_COUNTRIES)
+
+    return set(_local_cached_json(ACTIVE_COUNTRIES_CACHE_KEY, loader))
+
+
 def invalidate_directory_cache() -> None:
+    # 다른 워커 프로세스의 로컬 캐시는 버전 증가를 LOCAL_VERSION_CHECK_INTERVAL 안에 감지한다.
+    clear_local_directory_cache()
     r = get_redis()
     try:
-        r.delete(COUNTRY_CACHE_KEY)
-        r.delete(AIRPORT_CACHE_KEY)
-        r.delete(AIRPORT_INDEX_CACHE_KEY)
-        r.incr(DIRECTORY_VERSION_KEY)
+        with r.pipeline(transaction=False) as pipe:
+            pipe.delete(
+                COUNTRY_CACHE_KEY,
+                f"{COUNTRY_CACHE_KEY}:active",
+                AIRPORT_CACHE_KEY,
+                f"{AIRPORT_CACHE_KEY}:active",
+                AIRPORT_INDEX_CACHE_KEY,
+                COUNTRY_SEARCH_CACHE_KEY,
+                f"{COUNTRY_SEARCH_CACHE_KEY}:active",
+                AIRPORT_SEARCH_CACHE_KEY,
+                f"{AIRPORT_SEARCH_CACHE_KEY}:active",
+                ACTIVE_COUNTRIES_CACHE_KEY,
+            )
+            pipe.incr(DIRECTORY_VERSION_KEY)
+            pipe.execute()
     except RedisError:
         pass
 
 
-@lru_cache(maxsize=1)
-def _airportsdata_index() -> dict:
-    return load_airportsdata("IATA")
+def _build_iata_to_iso() -> Dict[str, str]:
+    index: Dict[str, str] = {}
+    for code, info in AIRPORTS_IATA.items():
+        candidate = info.get("iso_country") or info.get("country")
+        if candidate:
+            index[code] = candidate.upper()
+    return index
+
+
+_IATA_TO_ISO: Dict[str, str] = _build_iata_to_iso()
 
 
 def _clean(value: str | None) -> str | None:
@@ -410,6 +641,8 @@ __all__ = [
     "SyncResult",
     "resolve_country_code",
     "invalidate_directory_cache",
+    "clear_local_directory_cache",
+    "read_directory_version",
     "DIRECTORY_VERSION_KEY",
 ]
 
@@ -3,80 +3,86 @@
 from __future__ import annotations
 
 import logging
-from functools import lru_cache
+import time
 from typing import Any, Callable, Dict, Optional
 
-from airportsdata import load
-
-from app.core.cache import get_redis
 from sqlalchemy.orm import Session
 
 from app.db.session import SessionLocal
-from app.services.airport_directory import AirportDirectoryService, DIRECTORY_VERSION_KEY
+from app.services.airport_directory import AirportDirectoryService, read_directory_version
+from app.services.airports_data import AIRPORTS_IATA
 
 # ISO 3166-1 alpha-2 codes considered part of the Americas region for baggage policy
 # segmentation (North, Central, South America + Caribbean).
-AMERICAS_ISO2 = {
-    "AG",
-    "AI",
-    "AR",
-    "AW",
-    "BB",
-    "BL",
-    "BM",
-    "BO",
-    "BQ",
-    "BR",
-    "BS",
-    "BZ",
-    "CA",
-    "CL",
-    "CO",
-    "CR",
-    "CU",
-    "CW",
-    "DM",
-    "DO",
-    "EC",
-    "FK",
-    "GD",
-    "GF",
-    "GL",
-    "GP",
-    "GT",
-    "GY",
-    "HN",
-    "HT",
-    "JM",
-    "KN",
-    "KY",
-    "LC",
-    "MF",
-    "MQ",
-    "MS",
-    "MX",
-    "NI",
-    "PA",
-    "PE",
-    "PM",
-    "PR",
-    "PY",
-    "SR",
-    "SV",
-    "SX",
-    "TC",
-    "TT",
-    "US",
-    "UY",
-    "VC",
-    "VE",
-    "VG",
-    "VI",
-}
+AMERICAS_ISO2 = frozenset(
+    {
+        "AG",
+        "AI",
+        "AR",
+        "AW",
+        "BB",
+        "BL",
+        "BM",
+        "BO",
+        "BQ",
+        "BR",
+        "BS",
+        "BZ",
+        "CA",
+        "CL",
+        "CO",
+        "CR",
+        "CU",
+        "CW",
+        "DM",
+        "DO",
+        "EC",
+        "FK",
+        "GD",
+        "GF",
+        "GL",
+        "GP",
+        "GT",
+        "GY",
+        "HN",
+        "HT",
+        "JM",
+        "KN",
+        "KY",
+        "LC",
+        "MF",
+        "MQ",
+        "MS",
+        "MX",
+        "NI",
+        "PA",
+        "PE",
+        "PM",
+        "PR",
+        "PY",
+        "SR",
+        "SV",
+        "SX",
+        "TC",
+        "TT",
+        "US",
+        "UY",
+        "VC",
+        "VE",
+        "VG",
+        "VI",
+    }
+)
+
+_REGION_BUCKETS: Dict[str, str] = {iso: "americas" for iso in AMERICAS_ISO2}
+_REGION_BUCKETS["BR"] = "brazil"
 
 logger = logging.getLogger(__name__)
 
-_PROCESS_CACHE: Dict[str, Any] = {"version": None, "index": {}}
+# Redis의 디렉터리 버전은 최대 이 간격(초)마다 한 번만 확인한다.
+DIRECTORY_VERSION_CHECK_INTERVAL = 5.0
+
+_PROCESS_CACHE: Dict[str, Any] = {"version": None, "index": {}, "checked_at": 0.0}
 _SESSION_FACTORY: Callable[[], Session] = SessionLocal
 
 
@@ -95,7 +101,7 @@ def get_airport_info(iata_code: str) -> Optional[Dict[str, Any]]:
         return record
 
     # Fallback to bundled airportsdata dataset
-    return _airportsdata_index().get(code)
+    return AIRPORTS_IATA.get(code)
 
 
 def get_country_code(iata_code: str) -> Optional[str]:
@@ -116,16 +122,17 @@ def get_region_bucket(iata_code: str) -> Optional[str]:
     iso = get_country_code(iata_code)
     if not iso:
         return None
-    iso = iso.upper()
-    if iso == "BR":
-        return "brazil"
-    if iso in AMERICAS_ISO2:
-        return "americas"
-    return "international_non_americas"
+    # get_country_code already returns an uppercase ISO code.
+    return _REGION_BUCKETS.get(iso, "international_non_americas")
 
 
 def _load_directory_index() -> Dict[str, Dict[str, Any]]:
-    version = _directory_version()
+    now = time.monotonic()
+    if _PROCESS_CACHE.get("index") and now - _PROCESS_CACHE["checked_at"] < DIRECTORY_VERSION_CHECK_INTERVAL:
+        return _PROCESS_CACHE["index"]
+
+    version = read_directory_version()
+    _PROCESS_CACHE["checked_at"] = now
     cached_version = _PROCESS_CACHE.get("version")
     if cached_version == version and _PROCESS_CACHE.get("index"):
         return _PROCESS_CACHE["index"]
@@ -146,21 +153,6 @@ def _load_directory_index() -> Dict[str, Dict[str, Any]]:
     return normalized
 
 
-def _directory_version() -> str:
-    try:
-        value = get_redis().get(DIRECTORY_VERSION_KEY)
-        return value or "0"
-    except Exception:  # pragma: no cover - Redis가 없을 때
-        return "0"
-
-
-@lru_cache(maxsize=1)
-def _airportsdata_index() -> Dict[str, Dict[str, Any]]:
-    """Load the bundled airportsdata dataset once per process."""
-
-    return load("IATA")
-
-
 def set_airport_directory_session_factory(factory: Callable[[], Session]) -> None:
     """테스트나 백그라운드 작업에서 별도의 세션 팩토리를 주입할 때 사용."""
 
@@ -168,6 +160,7 @@ def set_airport_directory_session_factory(factory: Callable[[], Session]) -> Non
     _SESSION_FACTORY = factory
     _PROCESS_CACHE["version"] = None
     _PROCESS_CACHE["index"] = {}
+    _PROCESS_CACHE["checked_at"] = 0.0
 
 
 def reset_airport_directory_session_factory() -> None:
@@ -0,0 +1,13 @@
+"""Bundled `airportsdata` dataset, loaded once per process and shared by the airport helpers."""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from airportsdata import load
+
+# IATA code → airportsdata record (name, city, country, lat/lon, ...).
+AIRPORTS_IATA: Dict[str, Dict[str, Any]] = load("IATA")
+
+
+__all__ = ["AIRPORTS_IATA"]
@@ -98,11 +98,8 @@ class BagService:
 
         self.db.commit()
         self.db.refresh(bag)
-        return self._build_bag_summary(
-            bag,
-            self._count_items(bag.bag_id, status=None),
-            self._count_items(bag.bag_id, status="packed"),
-        )
+        total_items, packed_items = self._count_items_with_packed(bag.bag_id)
+        return self._build_bag_summary(bag, total_items, packed_items)
 
     def delete_bag(self, bag_id: int) -> None:
         bag = self._get_bag_for_user(bag_id)
@@ -215,15 +212,13 @@ class BagService:
             updated_at=item.updated_at,
         )
 
-    def _count_items(self, bag_id: int, status: str | None) -> int:
-        query = (
-            select(func.count())
-            .select_from(BagItem)
-            .where(
-                BagItem.bag_id == bag_id,
-                BagItem.user_id == self.auth.user.user_id,
-            )
+    def _count_items_with_packed(self, bag_id: int) -> tuple[int, int]:
+        query = select(
+            func.count(),
+            func.sum(case((BagItem.status == "packed", 1), else_=0)),
+        ).where(
+            BagItem.bag_id == bag_id,
+            BagItem.user_id == self.auth.user.user_id,
         )
-        if status:
-            query = query.where(BagItem.status == status)
-        return self.db.scalar(query) or 0
+        total, packed = self.db.execute(query).one()
+        return total or 0, packed or 0
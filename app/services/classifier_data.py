@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-import json
-from functools import lru_cache
+import sys
 from pathlib import Path
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple
+
+import orjson
 
 
 DATA_DIR = Path(__file__).resolve().parents[2] / "data" / "taxonomy"
@@ -17,16 +19,11 @@ def _read_json(name: str) -> Any:
     path = DATA_DIR / name
     if not path.exists():
         raise FileNotFoundError(f"Classifier asset not found: {path}")
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
-
+    with path.open("rb") as f:
+        return orjson.loads(f.read())
 
-@lru_cache(maxsize=1)
-def get_taxonomy_payload() -> Dict[str, Any]:
-    return _read_json("taxonomy.json")
 
-
-def _load_risk_keys() -> list[str]:
+def _load_risk_keys() -> tuple[str, ...]:
     try:
         data = _read_json(RISK_KEYS_FILE)
     except FileNotFoundError as exc:
@@ -41,28 +38,19 @@ def _load_risk_keys() -> list[str]:
 
     if not isinstance(keys, list) or not all(isinstance(item, str) for item in keys):
         raise ValueError("risk_keys.json must contain a list of string keys")
-    return keys
-
-
-@lru_cache(maxsize=1)
-def get_allowed_keys() -> tuple[str, ...]:
-    payload = get_taxonomy_payload()
-    keys = payload.get("allowed_keys", [])
     if not keys:
-        raise ValueError("taxonomy.json must include at least one allowed key")
+        raise ValueError("risk_keys.json must include at least one allowed key")
     return tuple(keys)
 
 
-@lru_cache(maxsize=1)
-def get_risk_keys() -> tuple[str, ...]:
-    keys = _load_risk_keys()
+def _load_allowed_keys(payload: Mapping[str, Any]) -> tuple[str, ...]:
+    keys = payload.get("allowed_keys", [])
     if not keys:
-        raise ValueError("risk_keys.json must include at least one allowed key")
+        raise ValueError("taxonomy.json must include at least one allowed key")
     return tuple(keys)
 
 
-@lru_cache(maxsize=1)
-def get_benign_keys() -> tuple[str, ...]:
+def _load_benign_keys() -> tuple[str, ...]:
     data = _read_json(BENIGN_KEYS_FILE)
     if not isinstance(data, list) or not all(isinstance(item, str) for item in data):
         raise ValueError("benign_keys.json must contain a list of string keys")
@@ -71,16 +59,63 @@ def get_benign_keys() -> tuple[str, ...]:
     return tuple(data)
 
 
-@lru_cache(maxsize=1)
-def get_display_names() -> Dict[str, str]:
-    payload = get_taxonomy_payload()
-    return payload.get("display_names", {})
+class Synonym(NamedTuple):
+    value: str
+    match_type: str = "substring"
+    priority: int = 0
 
 
-@lru_cache(maxsize=1)
-def get_synonym_map() -> Dict[str, List[Dict[str, Any]]]:
+def _load_synonym_map() -> Mapping[str, tuple[Synonym, ...]]:
     data = _read_json("synonyms.json")
     if not isinstance(data, dict):
         raise ValueError("synonyms.json must be an object mapping canonical key to entries")
-    return data
+    return MappingProxyType(
+        {
+            sys.intern(key): tuple(
+                Synonym(
+                    value=entry["value"],
+                    match_type=sys.intern(entry.get("match_type", "substring")),
+                    priority=int(entry.get("priority", 0)),
+                )
+                for entry in entries
+            )
+            for key, entries in data.items()
+        }
+    )
+
+
+# Assets are read-only config: load them once at import so misconfiguration fails fast.
+TAXONOMY_PAYLOAD: Mapping[str, Any] = MappingProxyType(_read_json("taxonomy.json"))
+ALLOWED_KEYS: tuple[str, ...] = _load_allowed_keys(TAXONOMY_PAYLOAD)
+RISK_KEYS: tuple[str, ...] = _load_risk_keys()
+BENIGN_KEYS: tuple[str, ...] = _load_benign_keys()
+DISPLAY_NAMES: Mapping[str, str] = MappingProxyType(TAXONOMY_PAYLOAD.get("display_names", {}))
+SYNONYM_MAP: Mapping[str, tuple[Synonym, ...]] = _load_synonym_map()
+
+
+def get_taxonomy_payload() -> Mapping[str, Any]:
+    return TAXONOMY_PAYLOAD
+
+
+def get_allowed_keys() -> tuple[str, ...]:
+    return ALLOWED_KEYS
+
+
+def get_risk_keys() -> tuple[str, ...]:
+    return RISK_KEYS
+
+
+def get_benign_keys() -> tuple[str, ...]:
+    return BENIGN_KEYS
+
+
+def get_display_names() -> Mapping[str, str]:
+    return DISPLAY_NAMES
+
+
+def get_synonym_map() -> Mapping[str, tuple[Synonym, ...]]:
+    return SYNONYM_MAP
+
 
+def get_synonyms_for(key: str) -> tuple[Synonym, ...]:
+    return SYNONYM_MAP.get(key, ())
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import calendar
-from datetime import UTC, date, datetime, timedelta
-from statistics import mean
+import threading
+from datetime import UTC, date, datetime
 from typing import Any
 
+from cachetools import TTLCache
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
@@ -22,7 +23,16 @@ from app.services.meteostat_client import MeteostatClient
 from app.services.trip_service import TripService
 
 
+CLIMATE_LOOKUP_CACHE_SIZE = 1024
+CLIMATE_LOOKUP_CACHE_TTL_SECONDS = 60 * 60
+
+
 class TripClimateService:
+    # 공항 좌표와 평년값은 거의 변하지 않으므로 프로세스 단위로 캐시
+    _coordinates_cache: TTLCache = TTLCache(maxsize=CLIMATE_LOOKUP_CACHE_SIZE, ttl=CLIMATE_LOOKUP_CACHE_TTL_SECONDS)
+    _normals_cache: TTLCache = TTLCache(maxsize=CLIMATE_LOOKUP_CACHE_SIZE, ttl=CLIMATE_LOOKUP_CACHE_TTL_SECONDS)
+    _cache_lock = threading.Lock()
+
     def __init__(
         self,
         db: Session,
@@ -86,15 +96,40 @@ class TripClimateService:
             generated_at=datetime.now(tz=UTC),
         )
 
+    @classmethod
+    def clear_caches(cls) -> None:
+        with cls._cache_lock:
+            cls._coordinates_cache.clear()
+            cls._normals_cache.clear()
+
     def _resolve_airport_coordinates(self, iata_code: str) -> AirportCoordinates | None:
-        return self.airlabs_client.get_coordinates(iata_code)
+        key = iata_code.strip().upper()
+        with self._cache_lock:
+            coords = self._coordinates_cache.get(key)
+        if coords is not None:
+            return coords
+        coords = self.airlabs_client.get_coordinates(key)
+        if coords is not None:
+            with self._cache_lock:
+                self._coordinates_cache[key] = coords
+        return coords
 
     def _fetch_point_normals(
         self,
         coords: AirportCoordinates,
     ) -> list[dict[str, Any]]:
+        # 인접 좌표는 같은 평년값을 공유하도록 반올림한 값을 키로 사용
+        key = (
+            round(coords.latitude, 2),
+            round(coords.longitude, 2),
+            round(coords.altitude_m) if coords.altitude_m is not None else None,
+        )
+        with self._cache_lock:
+            normals = self._normals_cache.get(key)
+        if normals is not None:
+            return normals
         try:
-            return self.meteostat_client.point_normals(
+            normals = self.meteostat_client.point_normals(
                 coords.latitude,
                 coords.longitude,
                 alt=coords.altitude_m,
@@ -105,6 +140,10 @@ class TripClimateService:
             raise HTTPException(status_code=503, detail="meteostat_unavailable") from exc
         except Exception as exc:  # pragma: no cover - defensive
             raise HTTPException(status_code=503, detail="meteostat_unavailable") from exc
+        if normals:
+            with self._cache_lock:
+                self._normals_cache[key] = normals
+        return normals
 
     def _build_breakdown(self, normals: list[dict[str, Any]], target_months: list[int]):
         month_map = {int(entry.get("month")): entry for entry in normals if entry.get("month") is not None}
@@ -129,18 +168,20 @@ class TripClimateService:
             raise HTTPException(status_code=400, detail="invalid_date_range")
         months: list[int] = []
         days_per_month: dict[int, int] = {}
-        cursor = start
-        while cursor <= end:
-            month = cursor.month
-            if month not in months:
+        first_month = (start.year, start.month)
+        last_month = (end.year, end.month)
+        year, month = first_month
+        while (year, month) <= last_month:
+            first_day = start.day if (year, month) == first_month else 1
+            last_day = end.day if (year, month) == last_month else calendar.monthrange(year, month)[1]
+            if month not in days_per_month:
                 months.append(month)
-            month_end_day = calendar.monthrange(cursor.year, month)[1]
-            segment_end = date(cursor.year, month, month_end_day)
-            if segment_end > end:
-                segment_end = end
-            days = (segment_end - cursor).days + 1
-            days_per_month[month] = days_per_month.get(month, 0) + days
-            cursor = segment_end + timedelta(days=1)
+                days_per_month[month] = 0
+            days_per_month[month] += last_day - first_day + 1
+            if month == 12:
+                year, month = year + 1, 1
+            else:
+                month += 1
         total_days = sum(days_per_month.values())
         return ClimatePeriod(months=months, days_per_month=days_per_month, total_days=total_days)
 
@@ -150,31 +191,45 @@ def _aggregate_breakdown(breakdown: list[ClimateMonthlyBreakdown], period: Clima
         raise HTTPException(status_code=503, detail="meteostat_no_data")
 
     weighted = agg == "weighted"
-    weights = period.days_per_month
-
-    def reducer(field: str, *, sum_mode: bool = False) -> float | None:
-        values = [(getattr(item, field), item.month) for item in breakdown if getattr(item, field) is not None]
-        if not values:
+    weights = [0] * 13
+    for month, days in period.days_per_month.items():
+        weights[month] = days
+
+    # 네 필드를 한 번의 순회로 누적: (값 개수, 단순합, 가중합, 가중치합)
+    counts = [0, 0, 0, 0]
+    plain_sums = [0.0, 0.0, 0.0, 0.0]
+    weighted_sums = [0.0, 0.0, 0.0, 0.0]
+    weight_totals = [0, 0, 0, 0]
+    for item in breakdown:
+        weight = weights[item.month]
+        # 강수량은 월 합계라 해당 월에 머무는 비율만큼만 더한다
+        precip_weight = weight / _DAYS_IN_MONTH_2000[item.month]
+        values = (item.t_mean_c, item.t_min_c, item.t_max_c, item.precip_sum_mm)
+        for idx, value in enumerate(values):
+            if value is None:
+                continue
+            value = float(value)
+            counts[idx] += 1
+            plain_sums[idx] += value
+            weighted_sums[idx] += value * (precip_weight if idx == _PRECIP_INDEX else weight)
+            weight_totals[idx] += weight
+
+    def finalize(idx: int) -> float | None:
+        if not counts[idx]:
+            return None
+        if not weighted:
+            return plain_sums[idx] / counts[idx]
+        if weight_totals[idx] == 0:
             return None
-        if weighted:
-            total_weight = sum(weights.get(month, 0) for _, month in values)
-            if total_weight == 0:
-                return None
-            acc = 0.0
-            for value, month in values:
-                weight = weights.get(month, 0)
-                if sum_mode:
-                    month_days = calendar.monthrange(2000, month)[1]
-                    weight = weight / month_days if month_days else 0
-                acc += float(value) * weight
-            return acc / total_weight if not sum_mode else acc
-        return mean(float(value) for value, _ in values)
+        if idx == _PRECIP_INDEX:
+            return weighted_sums[idx]
+        return weighted_sums[idx] / weight_totals[idx]
 
     return ClimateSummary(
-        t_mean_c=reducer("t_mean_c"),
-        t_min_c=reducer("t_min_c"),
-        t_max_c=reducer("t_max_c"),
-        precip_sum_mm=reducer("precip_sum_mm", sum_mode=True),
+        t_mean_c=finalize(0),
+        t_min_c=finalize(1),
+        t_max_c=finalize(2),
+        precip_sum_mm=finalize(_PRECIP_INDEX),
     )
 
 
@@ -202,6 +257,11 @@ def _extract_used_years(normals: list[dict[str, Any]]) -> list[int]:
     return years
 
 
+# 윤년(2000) 기준 월별 일수, 인덱스 = 월
+_DAYS_IN_MONTH_2000 = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_PRECIP_INDEX = 3
+
+
 def _safe_float(value: Any) -> float | None:
     if value is None:
         return None
@@ -2,9 +2,8 @@ from __future__ import annotations
 
 import hashlib
 import secrets
-from copy import deepcopy
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from sqlalchemy import select, update
@@ -43,6 +42,29 @@ class DeviceRegistryError(Exception):
         super().__init__(code)
 
 
+_PROFILE_MANAGED_FLAG_KEYS = frozenset({"profile", "feature_flags", "ab_test_bucket"})
+
+
+def _build_locale_prefix_index(locales: list[str]) -> dict[str, str]:
+    index: dict[str, str] = {}
+    for locale in locales:
+        index.setdefault(locale.split("-")[0], locale)
+    return index
+
+
+_LOCALE_SET = frozenset(settings.supported_locales)
+_LOCALE_PREFIX_INDEX = _build_locale_prefix_index(settings.supported_locales)
+
+
+def _clone_jsonish(value: Any) -> Any:
+    """JSON 호환 구조(dict/list/스칼라) 전용 deepcopy."""
+    if isinstance(value, dict):
+        return {key: _clone_jsonish(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_clone_jsonish(item) for item in value]
+    return value
+
+
 class DeviceRegistry:
     def __init__(self, db: Session) -> None:
         self.db = db
@@ -50,13 +72,13 @@ class DeviceRegistry:
     def register_device(self, payload: dict[str, Any], accept_language: str | None) -> DeviceRegistrationResult:
         device_uuid = payload["device_uuid"].strip()
         user = self._get_or_create_user(device_uuid)
-        feature_flags, ab_bucket = self._apply_profile(user, payload, accept_language)
+        feature_flags, ab_bucket = self._apply_profile(user, payload, accept_language, now=self._now())
         self.db.commit()
         self.db.refresh(user)
         return DeviceRegistrationResult(user=user, feature_flags=feature_flags, ab_test_bucket=ab_bucket)
 
     def update_user(self, user: User, payload: dict[str, Any], accept_language: str | None) -> DeviceRegistrationResult:
-        feature_flags, ab_bucket = self._apply_profile(user, payload, accept_language)
+        feature_flags, ab_bucket = self._apply_profile(user, payload, accept_language, now=self._now())
         self.db.commit()
         self.db.refresh(user)
         return DeviceRegistrationResult(user=user, feature_flags=feature_flags, ab_test_bucket=ab_bucket)
@@ -77,15 +99,16 @@ class DeviceRegistry:
 
     def generate_recovery_code(self, user: User) -> RecoveryCodeResult:
         now = self._now()
-        active_codes = self.db.scalars(
-            select(DeviceRecoveryCode).where(
+        self.db.execute(
+            update(DeviceRecoveryCode)
+            .where(
                 DeviceRecoveryCode.user_id == user.user_id,
                 DeviceRecoveryCode.redeemed_at.is_(None),
                 DeviceRecoveryCode.revoked_at.is_(None),
             )
-        ).all()
-        for record in active_codes:
-            record.revoked_at = now
+            .values(revoked_at=now)
+            .execution_options(synchronize_session=False)
+        )
 
         code = self._generate_code()
         record = DeviceRecoveryCode(
@@ -107,17 +130,14 @@ class DeviceRegistry:
     ) -> DeviceRegistrationResult:
         code_hash = self._hash_code(code)
         now = self._now()
-        record = self.db.scalar(
-            select(DeviceRecoveryCode)
-            .where(
-                DeviceRecoveryCode.code_hash == code_hash,
-                DeviceRecoveryCode.revoked_at.is_(None),
-                DeviceRecoveryCode.redeemed_at.is_(None),
-                DeviceRecoveryCode.expires_at > now,
-            )
-            .order_by(DeviceRecoveryCode.created_at.desc())
-        )
-        if not record:
+        # code_hash는 유니크 제약이 있어 단일 행 조회 후 유효성은 앱에서 확인
+        record = self.db.scalar(select(DeviceRecoveryCode).where(DeviceRecoveryCode.code_hash == code_hash))
+        if (
+            not record
+            or record.revoked_at is not None
+            or record.redeemed_at is not None
+            or record.expires_at <= now
+        ):
             raise DeviceRegistryError("recovery_code_invalid", status_code=404)
 
         user = self.db.get(User, record.user_id)
@@ -131,7 +151,7 @@ class DeviceRegistry:
 
         user.device_uuid = target_uuid
         record.redeemed_at = now
-        feature_flags, ab_bucket = self._apply_profile(user, new_device_payload, accept_language)
+        feature_flags, ab_bucket = self._apply_profile(user, new_device_payload, accept_language, now=now)
         self.db.commit()
         self.db.refresh(user)
         return DeviceRegistrationResult(user=user, feature_flags=feature_flags, ab_test_bucket=ab_bucket)
@@ -151,30 +171,43 @@ class DeviceRegistry:
         stmt = select(User).where(User.device_uuid == device_uuid)
         return self.db.scalar(stmt)
 
-    def _apply_profile(self, user: User, payload: dict[str, Any], accept_language: str | None) -> tuple[dict[str, Any], str]:
+    def _apply_profile(
+        self,
+        user: User,
+        payload: dict[str, Any],
+        accept_language: str | None,
+        *,
+        now: datetime,
+    ) -> tuple[dict[str, Any], str]:
         locale = self._resolve_locale(payload.get("locale"), accept_language, user.locale)
         profile = self._build_profile(flags=user.flags, payload=payload, locale=locale)
-        feature_flags = deepcopy(user.flags.get("feature_flags")) if user.flags else None
+        feature_flags = _clone_jsonish(user.flags.get("feature_flags")) if user.flags else None
         if not feature_flags:
-            feature_flags = deepcopy(settings.feature_flags_defaults)
+            # 기본 플래그는 bool 값만 담은 평면 dict라 얕은 복사로 충분
+            feature_flags = dict(settings.feature_flags_defaults)
         ab_bucket = (user.flags or {}).get("ab_test_bucket")
         if not ab_bucket:
             fallback_uuid = payload.get("device_uuid") or user.device_uuid or ""
             ab_bucket = self._assign_ab_bucket(fallback_uuid)
 
-        next_flags = deepcopy(user.flags) if user.flags else {}
+        # 아래에서 덮어쓸 키는 복제하지 않는다
+        next_flags = {
+            key: _clone_jsonish(value)
+            for key, value in (user.flags or {}).items()
+            if key not in _PROFILE_MANAGED_FLAG_KEYS
+        }
         next_flags["profile"] = profile
         next_flags["feature_flags"] = feature_flags
         next_flags["ab_test_bucket"] = ab_bucket
 
         user.flags = next_flags
         user.locale = locale
-        user.last_seen_at = self._now()
+        user.last_seen_at = now
         self.db.add(user)
         return feature_flags, ab_bucket
 
     def _build_profile(self, flags: dict[str, Any] | None, payload: dict[str, Any], locale: str) -> dict[str, Any]:
-        profile = deepcopy((flags or {}).get("profile", {}))
+        profile = _clone_jsonish((flags or {}).get("profile", {}))
         profile.setdefault("device_uuid", payload.get("device_uuid"))
         profile["locale"] = locale
         for key in ("app_version", "os", "model", "timezone"):
@@ -184,34 +217,43 @@ class DeviceRegistry:
         return profile
 
     def _resolve_locale(self, explicit: str | None, accept_language: str | None, fallback: str | None) -> str:
-        candidates = settings.supported_locales
-        if explicit and explicit in candidates:
+        if explicit and explicit in _LOCALE_SET:
             return explicit
         if accept_language:
             for token in accept_language.split(","):
                 code = token.strip().split(";")[0]
                 if not code:
                     continue
-                if code in candidates:
+                if code in _LOCALE_SET:
                     return code
-                prefix = code.split("-")[0]
-                for cand in candidates:
-                    if cand.startswith(prefix):
-                        return cand
+                matched = _LOCALE_PREFIX_INDEX.get(code.split("-")[0])
+                if matched:
+                    return matched
         if fallback:
             return fallback
-        return candidates[0]
+        return settings.supported_locales[0]
 
     def _assign_ab_bucket(self, device_uuid: str) -> str:
         buckets = settings.ab_test_buckets or ["control"]
-        digest = hashlib.sha1(device_uuid.encode("utf-8")).hexdigest()
-        index = int(digest[:8], 16) % len(buckets)
+        digest = hashlib.blake2b(device_uuid.encode("utf-8"), digest_size=4).digest()
+        index = int.from_bytes(digest, "big") % len(buckets)
         return buckets[index]
 
     def _generate_code(self) -> str:
         alphabet = settings.device_recovery_code_charset or "ABCDEFGHJKLMNPQRSTUVWXYZ23456789"
         length = max(6, min(settings.device_recovery_code_length, 12))
-        return "".join(secrets.choice(alphabet) for _ in range(length))
+        # 난수는 한 번에 받아오고, 2의 거듭제곱 마스크 + 기각 샘플링으로 편향 없이 인덱스를 고른다
+        size = len(alphabet)
+        mask = (1 << (size - 1).bit_length()) - 1
+        picks: list[str] = []
+        while len(picks) < length:
+            for byte in secrets.token_bytes(length * 2):
+                index = byte & mask
+                if index < size:
+                    picks.append(alphabet[index])
+                    if len(picks) == length:
+                        break
+        return "".join(picks)
 
     def _hash_code(self, code: str) -> str:
         return hashlib.sha256(code.strip().upper().encode("utf-8")).hexdigest()
@@ -219,16 +261,19 @@ class DeviceRegistry:
     def _merge_users(self, primary: User, secondary: User) -> None:
         if primary.user_id == secondary.user_id:
             return
+        # 병합 직후 세션에 해당 행들이 로드돼 있지 않으므로 identity map 동기화는 생략
         for model in (Trip, Bag, BagItem, ItemImage, RegulationMatch):
             self.db.execute(
                 update(model)
                 .where(model.user_id == secondary.user_id)
                 .values(user_id=primary.user_id)
+                .execution_options(synchronize_session=False)
             )
         self.db.flush()
         self.db.delete(secondary)
 
     @staticmethod
     def _now() -> datetime:
-        return datetime.utcnow()
+        # DB 컬럼이 naive TIMESTAMP(UTC)라 tzinfo는 제거해서 비교한다
+        return datetime.now(UTC).replace(tzinfo=None)
 
@@ -3,13 +3,18 @@ from __future__ import annotations
 import base64
 import hashlib
 import hmac
-import json
 import time
 from dataclasses import dataclass
-from typing import Any, TypedDict
+from functools import lru_cache
+import orjson
+from pydantic import TypeAdapter, ValidationError
+from typing_extensions import TypedDict
 
 from app.core.config import settings
 
+# SHA-256 digest(32 bytes)의 패딩 없는 base64url 길이
+_SIGNATURE_LENGTH = 43
+
 
 class DeviceTokenError(Exception):
     """Raised when a device token cannot be issued or verified."""
@@ -28,6 +33,10 @@ class TokenPayload(TypedDict):
     exp: int
 
 
+# JSON 파싱과 필드 검증/형변환을 pydantic-core에서 한 번에 처리
+_PAYLOAD_ADAPTER = TypeAdapter(TokenPayload)
+
+
 @dataclass(slots=True)
 class IssuedToken:
     token: str
@@ -47,38 +56,34 @@ def issue_device_token(user_id: int, device_uuid: str, ttl_seconds: int | None =
         "exp": now + ttl,
     }
     encoded = _encode_payload(payload)
-    signature = _sign(encoded)
-    token = f"{encoded}.{signature}"
+    token = (encoded + b"." + _sign(encoded)).decode("ascii")
     return IssuedToken(token=token, payload=payload)
 
 
 def verify_device_token(token: str) -> TokenPayload:
     if not token:
         raise DeviceTokenError("token_missing")
-    parts = token.split(".")
+    try:
+        raw_token = token.encode("ascii")
+    except UnicodeEncodeError as exc:
+        raise DeviceTokenError("token_malformed") from exc
+    parts = raw_token.split(b".")
     if len(parts) != 2:
         raise DeviceTokenError("token_malformed")
     payload_part, signature_part = parts
+    # 길이는 고정값이라 비밀 정보를 노출하지 않으므로 HMAC 계산 전에 거른다
+    if len(signature_part) != _SIGNATURE_LENGTH:
+        raise DeviceTokenError("invalid_signature")
     expected_signature = _sign(payload_part)
     if not hmac.compare_digest(signature_part, expected_signature):
         raise DeviceTokenError("invalid_signature")
 
     try:
-        payload_dict: dict[str, Any] = json.loads(_decode_payload(payload_part))
-    except json.JSONDecodeError as exc:  # pragma: no cover - defensive
-        raise DeviceTokenError("token_corrupted") from exc
-
-    required_fields = {"v", "uid", "du", "iat", "exp"}
-    if not required_fields.issubset(payload_dict):
-        raise DeviceTokenError("token_fields_missing")
-
-    payload: TokenPayload = {
-        "v": int(payload_dict["v"]),
-        "uid": int(payload_dict["uid"]),
-        "du": str(payload_dict["du"]),
-        "iat": int(payload_dict["iat"]),
-        "exp": int(payload_dict["exp"]),
-    }
+        payload = _PAYLOAD_ADAPTER.validate_json(_decode_payload(payload_part))
+    except ValidationError as exc:
+        if any(error["type"] == "json_invalid" for error in exc.errors()):
+            raise DeviceTokenError("token_corrupted") from exc
+        raise DeviceTokenError("token_fields_missing") from exc
 
     if payload["v"] != settings.device_token_version:
         raise DeviceTokenError("token_version_mismatch")
@@ -94,19 +99,30 @@ def token_expires_in(payload: TokenPayload) -> int:
     return max(payload["exp"] - int(time.time()), 0)
 
 
-def _encode_payload(payload: TokenPayload) -> str:
-    raw = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
-    return base64.urlsafe_b64encode(raw).decode("utf-8").rstrip("=")
+def _b64url_nopad(raw: bytes) -> bytes:
+    encoded = base64.urlsafe_b64encode(raw)
+    pad = -len(raw) % 3
+    return encoded[:-pad] if pad else encoded
+
+
+def _encode_payload(payload: TokenPayload) -> bytes:
+    return _b64url_nopad(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS))
+
+
+def _decode_payload(encoded: bytes) -> bytes:
+    padding = b"=" * (-len(encoded) % 4)
+    return base64.urlsafe_b64decode(encoded + padding)
 
 
-def _decode_payload(encoded: str) -> str:
-    padding = "=" * (-len(encoded) % 4)
-    raw = base64.urlsafe_b64decode(encoded + padding)
-    return raw.decode("utf-8")
+@lru_cache(maxsize=2)
+def _hmac_template(secret: bytes) -> hmac.HMAC:
+    # 키 패딩/내부 해시 초기화는 비밀키마다 한 번만 하고 서명마다 copy()로 재사용
+    return hmac.new(secret, digestmod=hashlib.sha256)
 
 
-def _sign(message: str) -> str:
-    secret = settings.guest_hmac_secret.encode("utf-8")
-    digest = hmac.new(secret, msg=message.encode("utf-8"), digestmod=hashlib.sha256).digest()
-    return base64.urlsafe_b64encode(digest).decode("utf-8").rstrip("=")
+def _sign(message: bytes) -> bytes:
+    # 설정의 비밀키가 바뀌면(테스트, 키 교체) 새 키로 만든 템플릿을 쓴다
+    mac = _hmac_template(settings.guest_hmac_secret.encode("utf-8")).copy()
+    mac.update(message)
+    return _b64url_nopad(mac.digest())
 
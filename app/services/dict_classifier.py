@@ -2,25 +2,34 @@
 
 from __future__ import annotations
 
+import heapq
 import math
 import re
 import unicodedata
 from dataclasses import dataclass
-from functools import cached_property
-from typing import DefaultDict, Dict, List
+from functools import lru_cache
+from typing import Dict, List, NamedTuple
 
-from app.services.classifier_data import get_allowed_keys, get_synonym_map
+from app.services.classifier_data import get_allowed_keys, get_synonyms_for
 
 
 SPACE_RE = re.compile(r"\s+")
+_CANONICAL_FORMS = {"e-cig": "ecig", "보조 배터리": "보조배터리"}
+_CANONICAL_RE = re.compile("|".join(re.escape(form) for form in _CANONICAL_FORMS))
 
 
+def _canonical_replacement(match: re.Match[str]) -> str:
+    return _CANONICAL_FORMS[match.group(0)]
+
+
+@lru_cache(maxsize=4096)
 def normalize_label(label: str) -> str:
     if not label:
         return ""
-    text = unicodedata.normalize("NFKC", label)
+    # ASCII 문자열은 NFKC 결과가 동일하므로 정규화를 건너뛴다
+    text = label if label.isascii() else unicodedata.normalize("NFKC", label)
     text = SPACE_RE.sub(" ", text.strip().lower())
-    text = text.replace("e-cig", "ecig").replace("보조 배터리", "보조배터리")
+    text = _CANONICAL_RE.sub(_canonical_replacement, text)
     return text
 
 
@@ -33,6 +42,30 @@ RULES: tuple[tuple[re.Pattern[str], str, float], ...] = (
     (re.compile(r"(dry ice|드라이아이스)"), "dry_ice", 0.8),
 )
 
+# RULES를 하나의 패턴으로 합쳐 라벨을 한 번만 스캔한다.
+# 전방탐색으로 감싸 서로 다른 위치에서 시작하는 매치는 겹쳐도 모두 잡히지만,
+# 같은 위치에서는 앞선 규칙 하나만 보고되므로 규칙끼리 같은 위치에서 매치되는 단어를 두지 않는다
+# (tests/test_dict_classifier.py에서 확인).
+_FUSED_RULES = re.compile(
+    "|".join(f"(?=(?P<r{idx}>{pattern.pattern}))" for idx, (pattern, _, _) in enumerate(RULES))
+)
+
+
+class _PartialEntry(NamedTuple):
+    token: str
+    canonical: str
+    weight: float
+    pattern: re.Pattern[str] | None
+
+
+def _sigmoid(score: float) -> float:
+    return 1 / (1 + math.exp(-(0.8 * score - 0.5)))
+
+
+_SIGMOID_LUT_SIZE = 256
+_SIGMOID_LUT_SCALE = 25.0
+_SIGMOID_LUT = tuple(_sigmoid(i / _SIGMOID_LUT_SCALE) for i in range(_SIGMOID_LUT_SIZE))
+
 
 @dataclass(slots=True)
 class DictionaryClassification:
@@ -45,45 +78,91 @@ class DictionaryClassification:
     signals: dict
 
 
+@dataclass(frozen=True, slots=True)
+class _MatchTables:
+    exact_map: Dict[str, str]
+    partial_entries: tuple[_PartialEntry, ...]
+    # 토큰 앞 두 글자 -> (토큰, partial entry 인덱스들) 목록
+    bigram_index: Dict[str, tuple[tuple[str, tuple[int, ...]], ...]]
+    # 두 글자 미만 토큰은 바이그램이 없으므로 별도로 `in` 검사
+    short_tokens: tuple[tuple[str, tuple[int, ...]], ...]
+    regex_entries: tuple[tuple[int, re.Pattern[str]], ...]
+
+
+@lru_cache(maxsize=1)
+def _build_match_tables() -> _MatchTables:
+    """동의어 정규화/컴파일은 프로세스당 한 번만 수행하고 모든 인스턴스가 공유한다."""
+    exact_map: Dict[str, str] = {}
+    entries: list[_PartialEntry] = []
+    for canonical in get_allowed_keys():
+        exact_map[normalize_label(canonical)] = canonical
+        for entry in get_synonyms_for(canonical):
+            if entry.match_type == "exact":
+                exact_map[normalize_label(entry.value)] = canonical
+            elif entry.match_type in ("substring", "regex"):
+                token = normalize_label(entry.value)
+                weight = 1.0 + 0.2 * entry.priority + min(0.3, len(token) / 20.0)
+                pattern = re.compile(entry.value) if entry.match_type == "regex" else None
+                entries.append(_PartialEntry(token, canonical, weight, pattern))
+
+    token_indices: Dict[str, List[int]] = {}
+    regex_entries: list[tuple[int, re.Pattern[str]]] = []
+    for idx, entry in enumerate(entries):
+        if entry.pattern is None:
+            token_indices.setdefault(entry.token, []).append(idx)
+        else:
+            regex_entries.append((idx, entry.pattern))
+
+    bigram_lists: Dict[str, list[tuple[str, tuple[int, ...]]]] = {}
+    short_tokens: list[tuple[str, tuple[int, ...]]] = []
+    for token, indices in token_indices.items():
+        if len(token) < 2:
+            short_tokens.append((token, tuple(indices)))
+        else:
+            bigram_lists.setdefault(token[:2], []).append((token, tuple(indices)))
+
+    return _MatchTables(
+        exact_map=exact_map,
+        partial_entries=tuple(entries),
+        bigram_index={bigram: tuple(items) for bigram, items in bigram_lists.items()},
+        short_tokens=tuple(short_tokens),
+        regex_entries=tuple(regex_entries),
+    )
+
+
 class DictionaryClassifier:
+    __slots__ = ("allowed_keys", "_tables")
+
     def __init__(self) -> None:
         self.allowed_keys = get_allowed_keys()
-        self.synonym_map = get_synonym_map()
-
-    @cached_property
-    def _exact_map(self) -> Dict[str, str]:
-        mapping: Dict[str, str] = {}
-        for canonical in self.allowed_keys:
-            mapping[normalize_label(canonical)] = canonical
-            for entry in self.synonym_map.get(canonical, []):
-                if entry.get("match_type", "substring") == "exact":
-                    mapping[normalize_label(entry["value"])] = canonical
-        return mapping
-
-    @cached_property
-    def _partial_entries(self) -> list[dict]:
-        entries: list[dict] = []
-        for canonical in self.allowed_keys:
-            for entry in self.synonym_map.get(canonical, []):
-                if entry.get("match_type", "substring") != "exact":
-                    token = normalize_label(entry["value"])
-                    data = {
-                        "canonical": canonical,
-                        "token": token,
-                        "priority": int(entry.get("priority", 0)),
-                        "match_type": entry.get("match_type", "substring"),
-                    }
-                    if data["match_type"] == "regex":
-                        data["pattern"] = re.compile(entry["value"])
-                    entries.append(data)
-        return entries
+        # 첫 classify 호출의 지연을 없애도록 생성 시점에 매칭 테이블을 준비
+        self._tables = _build_match_tables()
+
+    def _match_partial_entries(self, norm: str) -> list[int]:
+        # 엔트리마다 `token in norm`을 도는 대신, norm의 각 위치에서 바이그램으로 후보 토큰만 골라 비교
+        matched: set[int] = set()
+        tables = self._tables
+        bigram_index = tables.bigram_index
+        for start in range(len(norm) - 1):
+            candidates = bigram_index.get(norm[start : start + 2])
+            if candidates:
+                for token, indices in candidates:
+                    if norm.startswith(token, start):
+                        matched.update(indices)
+        for token, indices in tables.short_tokens:
+            if token in norm:
+                matched.update(indices)
+        for idx, pattern in tables.regex_entries:
+            if pattern.search(norm):
+                matched.add(idx)
+        return sorted(matched)
 
     def classify(self, raw_label: str) -> DictionaryClassification:
         norm = normalize_label(raw_label)
         if not norm:
             return self._empty(norm)
 
-        exact_hit = self._exact_map.get(norm)
+        exact_hit = self._tables.exact_map.get(norm)
         if exact_hit:
             payload = {
                 "canonical": exact_hit,
@@ -96,41 +175,32 @@ class DictionaryClassifier:
             }
             return DictionaryClassification(**payload)
 
-        scores: DefaultDict[str, float] = DefaultDict(float)
-        hits: DefaultDict[str, List[str]] = DefaultDict(list)
-
-        for entry in self._partial_entries:
-            canonical = entry["canonical"]
-            match_type = entry["match_type"]
-            token = entry["token"]
-            matched = False
-            if match_type == "substring":
-                matched = token in norm
-            elif match_type == "regex":
-                pattern: re.Pattern[str] = entry["pattern"]
-                matched = bool(pattern.search(norm))
-
-            if matched:
-                weight = 1.0 + 0.2 * entry["priority"] + min(0.3, len(token) / 20.0)
-                scores[canonical] += weight
-                hits[canonical].append(token)
+        scores: Dict[str, float] = {}
+        hits: Dict[str, List[str]] = {}
+
+        entries = self._tables.partial_entries
+        for idx in self._match_partial_entries(norm):
+            token, canonical, weight, _ = entries[idx]
+            scores[canonical] = scores.get(canonical, 0.0) + weight
+            hits.setdefault(canonical, []).append(token)
 
         rule_hits: list[dict] = []
-        for pattern, canonical, weight in RULES:
-            if pattern.search(norm):
-                scores[canonical] += weight
-                rule_hits.append({"rule": pattern.pattern, "canonical": canonical, "weight": weight})
+        matched_rules = {int(match.lastgroup[1:]) for match in _FUSED_RULES.finditer(norm)}
+        for idx in sorted(matched_rules):
+            pattern, canonical, weight = RULES[idx]
+            scores[canonical] = scores.get(canonical, 0.0) + weight
+            rule_hits.append({"rule": pattern.pattern, "canonical": canonical, "weight": weight})
 
         if not scores:
             return self._empty(norm, mode="none", rule_hits=rule_hits)
 
-        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
-        categories = [{"key": key, "score": round(score, 3)} for key, score in ranked[:5]]
+        ranked = heapq.nlargest(5, scores.items(), key=lambda item: item[1])
+        categories = [{"key": key, "score": round(score, 3)} for key, score in ranked]
         top_key, top_score = ranked[0]
         confidence = self._score_to_conf(top_score)
         candidates = [item["key"] for item in categories[:3]]
         abstain = confidence < 0.5
-        signals = {"mode": "partial", "hits": dict(hits), "rules": rule_hits}
+        signals = {"mode": "partial", "hits": hits, "rules": rule_hits}
 
         return DictionaryClassification(
             canonical=top_key,
@@ -157,8 +227,13 @@ class DictionaryClassifier:
 
     @staticmethod
     def _score_to_conf(score: float) -> float:
-        value = 1 / (1 + math.exp(-(0.8 * score - 0.5)))
-        return round(value, 4)
+        # 점수 구간 [0, 10.2]는 룩업 테이블 + 선형 보간, 그 밖은 직접 계산
+        pos = score * _SIGMOID_LUT_SCALE
+        if pos < 0 or pos >= _SIGMOID_LUT_SIZE - 1:
+            return round(_sigmoid(score), 4)
+        idx = int(pos)
+        low = _SIGMOID_LUT[idx]
+        return round(low + (_SIGMOID_LUT[idx + 1] - low) * (pos - idx), 4)
 
 
 _DICT_CLASSIFIER: DictionaryClassifier | None = None
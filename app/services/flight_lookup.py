@@ -58,10 +58,14 @@ class FlightLookupService:
 
         return self._build_response(data)
 
-    def _build_endpoint(self, data: dict[str, Any], prefix: str) -> FlightEndpoint:
-        iata = self._safe_upper(data.get(f"{prefix}_iata"))
+    def _build_endpoint(
+        self,
+        data: dict[str, Any],
+        prefix: str,
+        iata: str | None,
+        info: dict[str, Any] | None,
+    ) -> FlightEndpoint:
         icao = self._safe_upper(data.get(f"{prefix}_icao"))
-        info = get_airport_info(iata) if iata else None
         return FlightEndpoint(
             airport_iata=iata,
             airport_icao=icao or (info.get("iata_code") if info else None),
@@ -101,10 +105,7 @@ class FlightLookupService:
             except (ValueError, OSError):
                 pass
         if isinstance(fallback_str, str) and fallback_str:
-            try:
-                return datetime.strptime(fallback_str, "%Y-%m-%d %H:%M").replace(tzinfo=UTC)
-            except ValueError:
-                return None
+            return _parse_airlabs_time(fallback_str)
         return None
 
     def _build_response(self, data: dict[str, Any]) -> FlightLookupResponse:
@@ -128,14 +129,9 @@ class FlightLookupService:
         )
 
     def _endpoint_with_metadata(self, data: dict[str, Any], prefix: str) -> FlightEndpoint:
-        base = self._build_endpoint(data, prefix)
-        if base.airport_iata:
-            info = get_airport_info(base.airport_iata)
-            if info:
-                base.airport_name = base.airport_name or info.get("name_en")
-                base.city = base.city or info.get("city_en")
-                base.country = base.country or info.get("country")
-        return base
+        iata = self._safe_upper(data.get(f"{prefix}_iata"))
+        info = get_airport_info(iata) if iata else None
+        return self._build_endpoint(data, prefix, iata, info)
 
     def _build_segment_hint(
         self,
@@ -154,3 +150,22 @@ class FlightLookupService:
         )
 
 
+def _parse_airlabs_time(value: str) -> datetime | None:
+    """AirLabs의 "YYYY-MM-DD HH:MM" 문자열을 UTC datetime으로 변환."""
+    # 고정 포맷은 슬라이싱으로 바로 파싱하고, 그 외 형태만 strptime으로 처리
+    if len(value) == 16 and value[4] == "-" and value[7] == "-" and value[10] == " " and value[13] == ":":
+        try:
+            return datetime(
+                int(value[0:4]),
+                int(value[5:7]),
+                int(value[8:10]),
+                int(value[11:13]),
+                int(value[14:16]),
+                tzinfo=UTC,
+            )
+        except ValueError:
+            return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d %H:%M").replace(tzinfo=UTC)
+    except ValueError:
+        return None
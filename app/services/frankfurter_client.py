@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import logging
+import threading
+from concurrent.futures import Future
 from datetime import date
 from typing import Any
 
 import requests
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from app.core.cache import cached_json
 from app.core.config import settings
@@ -12,13 +17,47 @@ from app.core.config import settings
 logger = logging.getLogger(__name__)
 
 
+def _build_default_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# 요청마다 클라이언트가 새로 만들어져도 TCP/TLS 연결은 프로세스 단위로 재사용한다.
+_DEFAULT_SESSION = _build_default_session()
+
+# Redis 앞단의 짧은 프로세스 캐시 (기준 통화/날짜별 전체 환율)
+_LOCAL_RATES: TTLCache = TTLCache(maxsize=128, ttl=settings.fx_cache_ttl_latest_sec)
+# 과거 날짜 환율은 바뀌지 않으므로 Redis와 같은 TTL로 따로 보관한다.
+_LOCAL_HISTORICAL_RATES: TTLCache = TTLCache(maxsize=256, ttl=settings.fx_cache_ttl_historical_sec)
+_LOCAL_RATES_LOCK = threading.Lock()
+# 같은 키를 동시에 요청한 호출들은 첫 호출의 HTTP 결과를 기다려 공유한다
+_INFLIGHT: dict[str, Future[dict[str, Any] | None]] = {}
+
+# 통화 이름 목록은 사실상 고정이므로 Redis 왕복 없이 프로세스에서 하루 동안 재사용
+_CURRENCIES_TTL_SEC = 60 * 60 * 24
+_LOCAL_CURRENCIES: TTLCache = TTLCache(maxsize=1, ttl=_CURRENCIES_TTL_SEC)
+
+
 class FrankfurterClient:
     """Fetch exchange rates from Frankfurter API (ECB reference rates)."""
 
     def __init__(self, session: requests.Session | None = None) -> None:
         self.base_url = settings.frankfurter_api_base_url
         self.timeout = settings.frankfurter_timeout_sec
-        self.session = session or requests.Session()
+        self.session = session or _DEFAULT_SESSION
 
     def fetch_latest(
         self, base: str, symbols: list[str] | None = None
@@ -38,38 +77,14 @@ class FrankfurterClient:
                 "source": "ECB via Frankfurter"
             } or None if error
         """
-        symbols_param = ",".join(symbols) if symbols else None
-        cache_key = self._cache_key_latest(base, symbols_param)
-
-        def loader() -> dict[str, Any] | None:
-            params = {"base": base.upper()}
-            if symbols_param:
-                params["symbols"] = symbols_param
-
-            try:
-                resp = self.session.get(
-                    f"{self.base_url}/v1/latest",
-                    params=params,
-                    timeout=self.timeout,
-                )
-                resp.raise_for_status()
-                data = resp.json()
-
-                return {
-                    "as_of": data.get("date"),
-                    "base": data.get("base", base.upper()),
-                    "rates": data.get("rates", {}),
-                    "source": "ECB via Frankfurter",
-                }
-            except requests.RequestException as exc:
-                logger.warning("Failed to fetch latest rates from Frankfurter: %s", exc)
-                return None
-            except (ValueError, KeyError) as exc:
-                logger.warning("Invalid response from Frankfurter: %s", exc)
-                return None
-
-        result = cached_json(cache_key, settings.fx_cache_ttl_latest_sec, loader)
-        return result
+        payload = self._fetch_all_rates(
+            "latest",
+            self._cache_key_latest(base),
+            base,
+            settings.fx_cache_ttl_latest_sec,
+            _LOCAL_RATES,
+        )
+        return _select_symbols(payload, symbols)
 
     def fetch_historical(
         self, target_date: date, base: str, symbols: list[str] | None = None
@@ -86,18 +101,57 @@ class FrankfurterClient:
             Same format as fetch_latest() or None if error
         """
         date_str = target_date.strftime("%Y-%m-%d")
-        symbols_param = ",".join(symbols) if symbols else None
-        cache_key = self._cache_key_historical(date_str, base, symbols_param)
+        payload = self._fetch_all_rates(
+            date_str,
+            self._cache_key_historical(date_str, base),
+            base,
+            settings.fx_cache_ttl_historical_sec,
+            _LOCAL_HISTORICAL_RATES,
+        )
+        return _select_symbols(payload, symbols)
+
+    def _fetch_all_rates(
+        self, path: str, cache_key: str, base: str, ttl: int, local_cache: TTLCache
+    ) -> dict[str, Any] | None:
+        """Fetch every rate for ``base`` once and share it across symbol lookups.
 
+        Per-symbol requests are answered by slicing this payload, so callers asking
+        for different currencies on the same base/date reuse one HTTP response.
+        """
+        with _LOCAL_RATES_LOCK:
+            cached = local_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            future = _INFLIGHT.get(cache_key)
+            owner = future is None
+            if owner:
+                future = Future()
+                _INFLIGHT[cache_key] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = self._load_all_rates(path, cache_key, base, ttl)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            if result is not None:
+                with _LOCAL_RATES_LOCK:
+                    local_cache[cache_key] = result
+            future.set_result(result)
+            return result
+        finally:
+            with _LOCAL_RATES_LOCK:
+                _INFLIGHT.pop(cache_key, None)
+
+    def _load_all_rates(self, path: str, cache_key: str, base: str, ttl: int) -> dict[str, Any] | None:
         def loader() -> dict[str, Any] | None:
-            params = {"base": base.upper()}
-            if symbols_param:
-                params["symbols"] = symbols_param
-
             try:
                 resp = self.session.get(
-                    f"{self.base_url}/v1/{date_str}",
-                    params=params,
+                    f"{self.base_url}/v1/{path}",
+                    params={"base": base.upper()},
                     timeout=self.timeout,
                 )
                 resp.raise_for_status()
@@ -110,18 +164,13 @@ class FrankfurterClient:
                     "source": "ECB via Frankfurter",
                 }
             except requests.RequestException as exc:
-                logger.warning(
-                    "Failed to fetch historical rates from Frankfurter for %s: %s",
-                    date_str,
-                    exc,
-                )
+                logger.warning("Failed to fetch %s rates from Frankfurter: %s", path, exc)
                 return None
             except (ValueError, KeyError) as exc:
                 logger.warning("Invalid response from Frankfurter: %s", exc)
                 return None
 
-        result = cached_json(cache_key, settings.fx_cache_ttl_historical_sec, loader)
-        return result
+        return cached_json(cache_key, ttl, loader)
 
     def get_currencies(self) -> dict[str, str] | None:
         """
@@ -131,6 +180,11 @@ class FrankfurterClient:
             {"USD": "United States Dollar", "KRW": "South Korean Won", ...} or None if error
         """
         cache_key = "fx:currencies"
+        with _LOCAL_RATES_LOCK:
+            cached = _LOCAL_CURRENCIES.get(cache_key)
+        if cached is not None:
+            # 프로세스 캐시의 dict를 호출자가 바꾸지 못하도록 사본을 돌려준다
+            return dict(cached)
 
         def loader() -> dict[str, str] | None:
             try:
@@ -149,16 +203,36 @@ class FrankfurterClient:
                 logger.warning("Invalid currencies response from Frankfurter: %s", exc)
                 return None
 
-        result = cached_json(cache_key, 60 * 60 * 24, loader)  # 24 hours cache
+        result = cached_json(cache_key, _CURRENCIES_TTL_SEC, loader)
+        if result:
+            with _LOCAL_RATES_LOCK:
+                _LOCAL_CURRENCIES[cache_key] = result
+            return dict(result)
         return result
 
-    def _cache_key_latest(self, base: str, symbols: str | None) -> str:
-        if symbols:
-            return f"fx:latest:{base.upper()}:{symbols.upper()}"
+    def _cache_key_latest(self, base: str) -> str:
         return f"fx:latest:{base.upper()}:all"
 
-    def _cache_key_historical(self, date_str: str, base: str, symbols: str | None) -> str:
-        if symbols:
-            return f"fx:date:{date_str}:{base.upper()}:{symbols.upper()}"
+    def _cache_key_historical(self, date_str: str, base: str) -> str:
         return f"fx:date:{date_str}:{base.upper()}:all"
 
+
+def _select_symbols(payload: dict[str, Any] | None, symbols: list[str] | None) -> dict[str, Any] | None:
+    """Slice the requested symbols out of the full table.
+
+    Like a ``symbols=`` request to Frankfurter, an unknown symbol fails the whole
+    lookup, so ``None`` is returned when any requested code is missing. The
+    payload is shared with the process cache, so a copy is always returned.
+    """
+    if payload is None:
+        return None
+    rates = payload.get("rates") or {}
+    if not symbols:
+        return {**payload, "rates": dict(rates)}
+    selected: dict[str, Any] = {}
+    for symbol in symbols:
+        code = symbol.upper()
+        if code not in rates:
+            return None
+        selected[code] = rates[code]
+    return {**payload, "rates": selected}
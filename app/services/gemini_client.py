@@ -20,18 +20,33 @@ class GeminiCircuitOpenError(GeminiClientError):
     """Raised when the circuit breaker is open."""
 
 
+_CONFIGURED_API_KEY: str | None = None
+_CONFIGURE_LOCK = threading.Lock()
+_CIRCUIT_CLOSED: tuple[int, float] = (0, 0.0)
+
+
+def _configure(api_key: str) -> None:
+    """genai.configure는 전역 상태를 바꾸므로 키가 바뀔 때만 호출한다."""
+    global _CONFIGURED_API_KEY
+    with _CONFIGURE_LOCK:
+        if _CONFIGURED_API_KEY == api_key:
+            return
+        genai.configure(api_key=api_key)
+        _CONFIGURED_API_KEY = api_key
+
+
 class GeminiClient:
     def __init__(self, api_key: str, model_name: str, timeout: float) -> None:
         if not api_key:
             raise ValueError("Gemini API key is required")
 
-        genai.configure(api_key=api_key)
+        _configure(api_key)
         self._model = genai.GenerativeModel(model_name)
         self._model_name = model_name
         self._timeout = timeout
+        # (연속 실패 횟수, 서킷 해제 시각)을 튜플 하나로 두고 통째로 교체해 항상 일관된 값을 읽는다
+        self._circuit_state: tuple[int, float] = _CIRCUIT_CLOSED
         self._lock = threading.Lock()
-        self._failure_count = 0
-        self._circuit_open_until = 0.0
 
     def generate_json(
         self,
@@ -43,10 +58,8 @@ class GeminiClient:
         if not prompt:
             raise ValueError("Prompt must not be empty")
 
-        now = time.monotonic()
-        with self._lock:
-            if now < self._circuit_open_until:
-                raise GeminiCircuitOpenError("Gemini circuit is open due to recent failures")
+        if time.monotonic() < self._circuit_state[1]:
+            raise GeminiCircuitOpenError("Gemini circuit is open due to recent failures")
 
         try:
             response = self._model.generate_content(
@@ -78,16 +91,20 @@ class GeminiClient:
             }
         return payload, model_info
 
+    # 상태 읽기는 튜플 교체로 락 없이 하고, 읽고-고쳐-쓰는 전이만 락으로 감싸 실패 횟수가 빠지지 않게 한다.
     def _record_failure(self, exc: Exception) -> None:
         with self._lock:
-            self._failure_count += 1
-            if self._failure_count >= 3:
-                self._circuit_open_until = time.monotonic() + 30
+            failures, open_until = self._circuit_state
+            failures += 1
+            if failures >= 3:
+                open_until = time.monotonic() + 30
+            self._circuit_state = (failures, open_until)
 
     def _record_success(self) -> None:
+        if self._circuit_state is _CIRCUIT_CLOSED:
+            return
         with self._lock:
-            self._failure_count = 0
-            self._circuit_open_until = 0.0
+            self._circuit_state = _CIRCUIT_CLOSED
 
 
 _CLIENTS: dict[tuple[str, float], GeminiClient] = {}
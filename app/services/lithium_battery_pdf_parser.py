@@ -6,11 +6,12 @@ they can be post-processed into regulation rules.
 
 from __future__ import annotations
 
-import json
 import logging
+import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Iterator
 
+import orjson
 import pdfplumber
 
 
@@ -19,18 +20,17 @@ logger = logging.getLogger(__name__)
 DEFAULT_PDF_PATH = Path("docs/Lithium Batteries in Baggage.pdf")
 
 
-def extract_tables(pdf_path: Path = DEFAULT_PDF_PATH) -> list[dict[str, Any]]:
+def extract_tables(pdf_path: Path = DEFAULT_PDF_PATH) -> Iterator[dict[str, Any]]:
     """Extract tables from the provided PDF.
 
-    Returns a list where each element contains the page number and the table
-    contents (rows represented as lists of cells).
+    Yields one element per table with the page number and the table contents
+    (rows represented as lists of cells), so callers never need every page's
+    tables in memory at once.
     """
 
     if not pdf_path.exists():
         raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
-    tables: list[dict[str, Any]] = []
-
     with pdfplumber.open(pdf_path) as pdf:
         for page_index, page in enumerate(pdf.pages, start=1):
             page_tables = page.extract_tables() or []
@@ -42,29 +42,37 @@ def extract_tables(pdf_path: Path = DEFAULT_PDF_PATH) -> list[dict[str, Any]]:
                     for row in table
                 ]
 
-                tables.append(
-                    {
-                        "page": page_index,
-                        "table_index": table_index,
-                        "rows": cleaned_rows,
-                    }
-                )
-
-    return tables
+                yield {
+                    "page": page_index,
+                    "table_index": table_index,
+                    "rows": cleaned_rows,
+                }
 
 
 def build_raw_json(pdf_path: Path = DEFAULT_PDF_PATH) -> dict[str, Any]:
-    tables = extract_tables(pdf_path)
     return {
         "source": str(pdf_path),
-        "tables": tables,
+        "tables": list(extract_tables(pdf_path)),
     }
 
 
+def write_raw_json(out: BinaryIO, pdf_path: Path = DEFAULT_PDF_PATH) -> None:
+    """Write the same indented document as ``build_raw_json`` one table at a time (UTF-8)."""
+
+    out.write(b'{\n  "source": ' + orjson.dumps(str(pdf_path)) + b',\n  "tables": [')
+    written = False
+    for table in extract_tables(pdf_path):
+        out.write(b",\n    " if written else b"\n    ")
+        # 표 하나를 2칸 들여쓰기로 직렬화한 뒤 "tables" 배열 깊이만큼 다시 들여쓴다
+        out.write(orjson.dumps(table, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n    "))
+        written = True
+    out.write(b"\n  ]\n}\n" if written else b"]\n}\n")
+
+
 def main() -> None:
     logging.basicConfig(level=logging.INFO)
-    data = build_raw_json()
-    print(json.dumps(data, ensure_ascii=False, indent=2))
+    write_raw_json(sys.stdout.buffer)
+    sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import logging
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
 from typing import Any, Dict, List
 
+import orjson
 import redis  # type: ignore[import-not-found]
 
 from app.core.cache import get_redis
@@ -67,30 +70,42 @@ class _TTLCache:
     def __init__(self, ttl_seconds: int, capacity: int) -> None:
         self.ttl = ttl_seconds
         self.capacity = capacity
-        self._store: dict[str, tuple[float, dict]] = {}
-
-    def get(self, key: str) -> dict | None:
-        entry = self._store.get(key)
-        if not entry:
-            return None
-        expires_at, value = entry
-        if expires_at < time.monotonic():
-            self._store.pop(key, None)
-            return None
-        return value
-
-    def set(self, key: str, value: dict) -> None:
-        if len(self._store) >= self.capacity:
-            self._store.pop(next(iter(self._store)))
-        self._store[key] = (time.monotonic() + self.ttl, value)
+        self._store: OrderedDict[str, tuple[float, LLMClassification]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> LLMClassification | None:
+        with self._lock:
+            entry = self._store.get(key)
+            if not entry:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                self._store.pop(key, None)
+                return None
+            self._store.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: LLMClassification, ttl_seconds: int | None = None) -> None:
+        ttl = self.ttl if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            # 조회 시 move_to_end로 갱신하므로 맨 앞이 가장 오래 쓰이지 않은 항목
+            if key in self._store:
+                self._store.move_to_end(key)
+            elif len(self._store) >= self.capacity:
+                self._store.popitem(last=False)
+            self._store[key] = (time.monotonic() + ttl, value)
 
 
 logger = logging.getLogger(__name__)
 
 _L1_CACHE = _TTLCache(settings.llm_classifier_cache_ttl_seconds, settings.llm_classifier_l1_cache_size)
-ALLOWED_KEYS = get_allowed_keys()
+ALLOWED_KEYS = frozenset(get_allowed_keys())
 _DETERMINISTIC_TEMP_CAP = 0.05
 
+# 캐시 미스가 동시에 난 같은 키는 첫 호출만 Gemini를 부르고 나머지는 그 결과를 기다린다
+_INFLIGHT: dict[str, Future[LLMClassification]] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
 
 def classify_with_llm(raw_label: str, locale: str | None = None) -> LLMClassification:
     if not settings.llm_classifier_enabled:
@@ -102,9 +117,48 @@ def classify_with_llm(raw_label: str, locale: str | None = None) -> LLMClassific
     cache_key = _build_cache_key(norm, locale)
 
     cached = _fetch_cache(cache_key)
-    if cached:
+    if cached is not None:
         return cached
 
+    result, owner = _classify_single_flight(raw_label, norm, cache_key, locale)
+    if owner:
+        _store_cache(cache_key, result)
+    return result
+
+
+def _classify_single_flight(
+    raw_label: str, norm: str, cache_key: str, locale: str | None
+) -> tuple[LLMClassification, bool]:
+    """Return ``(result, owner)``; only the owner's result still needs to be cached."""
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(cache_key)
+        owner = future is None
+        if owner:
+            future = Future()
+            _INFLIGHT[cache_key] = future
+
+    if not owner:
+        try:
+            return future.result(timeout=settings.llm_classifier_inflight_timeout_sec), False
+        except FutureTimeoutError as exc:
+            raise LLMClassificationError("Timed out waiting for in-flight classification") from exc
+
+    try:
+        result = _classify_uncached(raw_label, norm, locale)
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        # 대기 중이던 호출 이후에 들어오는 요청은 L1에서 바로 찾도록 먼저 채워 둔다
+        _L1_CACHE.set(cache_key, result, _cache_ttl(result))
+        future.set_result(result)
+        return result, True
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(cache_key, None)
+
+
+def _classify_uncached(raw_label: str, norm: str, locale: str | None) -> LLMClassification:
     prompt = _build_prompt(raw_label, norm, locale)
     temperature = max(0.0, settings.llm_classifier_temperature)
     if temperature > _DETERMINISTIC_TEMP_CAP:
@@ -124,49 +178,51 @@ def classify_with_llm(raw_label: str, locale: str | None = None) -> LLMClassific
     except (GeminiClientError, GeminiCircuitOpenError) as exc:  # pragma: no cover - network path
         raise LLMClassificationError(str(exc)) from exc
 
-    result = _parse_response(raw_label, norm, response_text, model_info)
-    _store_cache(cache_key, result)
-    return result
+    return _parse_response(raw_label, norm, response_text, model_info)
 
 
 def _build_cache_key(norm_label: str, locale: str | None) -> str:
     payload = f"{norm_label}|{locale or 'none'}".encode("utf-8")
-    digest = hashlib.sha256(payload).hexdigest()
+    # 암호학적 강도는 필요 없으므로 128비트 blake2b로 키 길이를 절반으로 줄인다
+    digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
     return f"llm:cls:{digest}"
 
 
 def _fetch_cache(cache_key: str) -> LLMClassification | None:
-    payload = _L1_CACHE.get(cache_key)
-    if payload:
-        return LLMClassification.from_cache_payload(payload)
+    # L1은 역직렬화된 결과 객체를 그대로 보관하므로 적중 시 복사가 없다
+    hit = _L1_CACHE.get(cache_key)
+    if hit is not None:
+        return hit
     try:
-        conn = get_redis()
-        cached = conn.get(cache_key)
-        if cached:
-            data = json.loads(cached)
-            _L1_CACHE.set(cache_key, data)
-            return LLMClassification.from_cache_payload(data)
-    except (redis.RedisError, json.JSONDecodeError):
+        cached = get_redis().get(cache_key)
+        if not cached:
+            return None
+        data = orjson.loads(cached)
+    except (redis.RedisError, orjson.JSONDecodeError):
         return None
-    return None
+    result = LLMClassification.from_cache_payload(data)
+    _L1_CACHE.set(cache_key, result, _cache_ttl(result))
+    return result
+
+
+def _cache_ttl(result: LLMClassification) -> int:
+    # abstain/파싱 실패는 짧게만 캐시해 반복되는 잡음 라벨은 흡수하되 일시적 실패가 오래 남지 않게 한다
+    if result.abstain:
+        return settings.llm_classifier_negative_cache_ttl_seconds
+    return settings.llm_classifier_cache_ttl_seconds
 
 
 def _store_cache(cache_key: str, result: LLMClassification) -> None:
-    payload = result.to_cache_payload()
-    _L1_CACHE.set(cache_key, payload)
     try:
-        conn = get_redis()
-        conn.setex(cache_key, settings.llm_classifier_cache_ttl_seconds, json.dumps(payload))
+        # 슬롯 데이터클래스는 orjson이 필드명 그대로 직렬화하므로 중간 dict가 필요 없다
+        get_redis().setex(cache_key, _cache_ttl(result), orjson.dumps(result))
     except redis.RedisError:
         pass
 
 
-def _build_prompt(raw_label: str, norm_label: str, locale: str | None) -> str:
-    allowed = ", ".join(f'"{key}"' for key in ALLOWED_KEYS)
-    label_json = json.dumps(raw_label, ensure_ascii=False)
-    norm_json = json.dumps(norm_label, ensure_ascii=False)
-    locale_value = locale or "unknown"
-    return f"""
+# 프롬프트에는 택소노미 순서를 유지해야 하므로 집합이 아닌 원본 순서로 조인
+_ALLOWED_KEYS_JOINED = ", ".join(f'"{key}"' for key in get_allowed_keys())
+_PROMPT_TEMPLATE = """
 System:
 You are a strict closed-set classifier for airline baggage items.
 Hard rules:
@@ -180,7 +236,7 @@ Hard rules:
 Generation settings: temperature = 0.0.
 
 User:
-ALLOWED_KEYS = [{allowed}]
+ALLOWED_KEYS = [{allowed_keys}]
 Label: {label_json}
 Normalized: {norm_json}
 Locale: "{locale_value}"
@@ -205,10 +261,35 @@ Constraints:
 """
 
 
+# 고정 부분은 import 시 한 번만 포맷하고, 요청마다 바뀌는 값 자리에서 잘라 둔다
+_PROMPT_HEAD, _PROMPT_AFTER_LABEL, _PROMPT_AFTER_NORM, _PROMPT_TAIL = _PROMPT_TEMPLATE.format(
+    allowed_keys=_ALLOWED_KEYS_JOINED,
+    label_json="\0",
+    norm_json="\0",
+    locale_value="\0",
+).split("\0")
+
+
+def _build_prompt(raw_label: str, norm_label: str, locale: str | None) -> str:
+    return "".join(
+        (
+            _PROMPT_HEAD,
+            orjson.dumps(raw_label).decode(),
+            _PROMPT_AFTER_LABEL,
+            orjson.dumps(norm_label).decode(),
+            _PROMPT_AFTER_NORM,
+            locale or "unknown",
+            _PROMPT_TAIL,
+        )
+    )
+
+
 def _parse_response(raw_label: str, norm_label: str, response_text: str, model_info: dict | None) -> LLMClassification:
     try:
-        payload = json.loads(response_text)
-    except json.JSONDecodeError:
+        payload = orjson.loads(response_text)
+    except orjson.JSONDecodeError:
+        payload = None
+    if not isinstance(payload, dict):
         return LLMClassification(
             raw_label=raw_label,
             norm_label=norm_label,
@@ -220,9 +301,9 @@ def _parse_response(raw_label: str, norm_label: str, response_text: str, model_i
             model_info=model_info,
         )
 
-    raw_signals = payload.get("signals") if isinstance(payload.get("signals"), dict) else {}
-    categories = _sanitize_categories(payload.get("categories", []))
-    top_raw = payload.get("top") if isinstance(payload.get("top"), dict) else None
+    raw_signals = payload.get("signals")
+    if not isinstance(raw_signals, dict):
+        raw_signals = {}
     abstain = bool(payload.get("abstain"))
 
     matched_terms = _sanitize_matched_terms(raw_signals.get("matched_terms"), raw_label, norm_label)
@@ -231,17 +312,21 @@ def _parse_response(raw_label: str, norm_label: str, response_text: str, model_i
         "language": raw_signals.get("language", "unknown"),
     }
 
-    combined_model_info = payload.get("model_info") if isinstance(payload.get("model_info"), dict) else {}
+    combined_model_info = payload.get("model_info")
+    if not isinstance(combined_model_info, dict):
+        combined_model_info = {}
     if model_info:
         combined_model_info = {**combined_model_info, **model_info}
 
     top_entry = None
     confidence = None
 
+    # abstain 응답은 카테고리를 버리므로 정제 자체를 건너뛴다
     if abstain:
         categories = []
-        top_entry = None
     else:
+        categories = _sanitize_categories(payload.get("categories", []))
+        top_raw = payload.get("top")
         top_entry = _determine_top_entry(categories, top_raw)
         confidence = float(top_entry["score"]) if top_entry and "score" in top_entry else None
 
@@ -323,10 +408,10 @@ def _sanitize_matched_terms(value: Any, raw_label: str, norm_label: str) -> list
     return cleaned
 
 
-def _determine_top_entry(categories: list[dict], top_raw: dict | None) -> dict | None:
+def _determine_top_entry(categories: list[dict], top_raw: Any) -> dict | None:
     if not categories:
         return None
-    requested_key = top_raw.get("key") if top_raw else None
+    requested_key = top_raw.get("key") if isinstance(top_raw, dict) else None
     if requested_key:
         for item in categories:
             if item["key"] == requested_key:
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import json
 import logging
-from typing import Any
+import orjson
+from pydantic import BaseModel
 
 from app.core.config import settings
+from app.schemas.decision import DutyFreeInfo, ItemParams, ItineraryInfo, SegmentInfo
 from app.schemas.preview import PreviewRequest
 from app.services.classifier_data import get_benign_keys, get_risk_keys
 from app.services.dict_classifier import normalize_label
@@ -28,10 +29,23 @@ class LLMDecisionError(RuntimeError):
     """Raised when the decision-specific LLM call fails or returns invalid JSON."""
 
 
+class _PromptInput(BaseModel):
+    """프롬프트 INPUT 블록. pydantic 직렬화기로 한 번에 JSON을 만든다."""
+
+    label: str
+    normalized_label: str
+    locale: str
+    itinerary: ItineraryInfo
+    segments: list[SegmentInfo]
+    item_params: ItemParams
+    duty_free: DutyFreeInfo
+
+
 def fetch_llm_decision(preview: PreviewRequest) -> LLMDecisionPayload:
     """Call Gemini once to obtain canonical + params + draft decision."""
 
-    prompt = _build_prompt(preview)
+    normalized = normalize_label(preview.label)
+    prompt = _build_prompt(preview, normalized)
     temperature = min(max(settings.llm_classifier_temperature, 0.0), _DETERMINISTIC_TEMP_CAP)
 
     try:
@@ -47,7 +61,7 @@ def fetch_llm_decision(preview: PreviewRequest) -> LLMDecisionPayload:
         payload = parse_llm_payload(response_text)
     except LLMResponseValidationError as exc:
         logger.warning("LLM payload invalid, attempting auto-fix: %s", exc)
-        fixed_text = _repair_matched_terms(response_text, preview)
+        fixed_text = _repair_matched_terms(response_text, preview, normalized)
         if fixed_text is None:
             raise LLMDecisionError(str(exc)) from exc
         try:
@@ -58,10 +72,10 @@ def fetch_llm_decision(preview: PreviewRequest) -> LLMDecisionPayload:
     if model_info:
         payload.model_info = {**(payload.model_info or {}), **model_info}
     return payload
-def _repair_matched_terms(response_text: str, preview: PreviewRequest) -> str | None:
+def _repair_matched_terms(response_text: str, preview: PreviewRequest, normalized: str) -> str | None:
     try:
-        data = json.loads(response_text)
-    except json.JSONDecodeError:
+        data = orjson.loads(response_text)
+    except orjson.JSONDecodeError:
         return None
 
     signals = data.get("signals")
@@ -91,13 +105,15 @@ def _repair_matched_terms(response_text: str, preview: PreviewRequest) -> str |
         return [stripped[:midpoint], stripped[midpoint:]]
 
     extra_terms: list[str] = []
+    seen = set(cleaned)
 
     def _add_tokens(tokens: list[str]) -> None:
         for token in tokens:
             if not token:
                 continue
-            if token in cleaned or token in extra_terms:
+            if token in seen:
                 continue
+            seen.add(token)
             extra_terms.append(token)
             if len(cleaned) + len(extra_terms) >= 4:
                 return
@@ -105,7 +121,6 @@ def _repair_matched_terms(response_text: str, preview: PreviewRequest) -> str |
     sources: list[str] = []
     if preview.label:
         sources.append(preview.label)
-        normalized = normalize_label(preview.label)
         if normalized:
             sources.append(normalized)
 
@@ -115,7 +130,7 @@ def _repair_matched_terms(response_text: str, preview: PreviewRequest) -> str |
             break
 
     if len(cleaned) + len(extra_terms) < 2 and preview.label:
-        filler = preview.label.strip() or normalize_label(preview.label)
+        filler = preview.label.strip() or normalized
         if filler:
             while len(cleaned) + len(extra_terms) < 2:
                 extra_terms.append(filler)
@@ -124,26 +139,12 @@ def _repair_matched_terms(response_text: str, preview: PreviewRequest) -> str |
     if len(merged) < 2:
         return None
     signals["matched_terms"] = merged
-    return json.dumps(data, ensure_ascii=False)
-
-
-def _build_prompt(preview: PreviewRequest) -> str:
-    risk_list = ", ".join(f'"{key}"' for key in RISK_KEYS)
-    benign_list = ", ".join(f'"{key}"' for key in BENIGN_KEYS)
-    itinerary = preview.itinerary.model_dump(by_alias=True)
-    segments = [segment.model_dump() for segment in preview.segments]
-    input_payload: dict[str, Any] = {
-        "label": preview.label,
-        "normalized_label": normalize_label(preview.label),
-        "locale": preview.locale or "unknown",
-        "itinerary": itinerary,
-        "segments": segments,
-        "item_params": preview.item_params.model_dump(),
-        "duty_free": preview.duty_free.model_dump(),
-    }
-    input_json = json.dumps(input_payload, ensure_ascii=False)
-
-    return f"""
+    return orjson.dumps(data).decode()
+
+
+_RISK_KEYS_JOINED = ", ".join(f'"{key}"' for key in RISK_KEYS)
+_BENIGN_KEYS_JOINED = ", ".join(f'"{key}"' for key in BENIGN_KEYS)
+_PROMPT_TEMPLATE = """
 System:
 You are a strict airline baggage classifier. Output VALID JSON only (no prose, no code fences).
 Hard rules:
@@ -185,4 +186,23 @@ BENIGN_KEYS = [{benign_list}]
 ALLOWED_KEYS = ALLOWED_RISK_KEYS + BENIGN_KEYS
 INPUT = {input_json}
 """
-
+# 고정 부분(키 목록 포함)은 import 시 한 번만 포맷하고 INPUT 자리에서 잘라 둔다
+_PROMPT_HEAD, _PROMPT_TAIL = _PROMPT_TEMPLATE.format(
+    risk_list=_RISK_KEYS_JOINED,
+    benign_list=_BENIGN_KEYS_JOINED,
+    input_json="\0",
+).split("\0")
+
+
+def _build_prompt(preview: PreviewRequest, normalized: str) -> str:
+    input_json = _PromptInput.model_construct(
+        label=preview.label,
+        normalized_label=normalized,
+        locale=preview.locale or "unknown",
+        itinerary=preview.itinerary,
+        segments=preview.segments,
+        item_params=preview.item_params,
+        duty_free=preview.duty_free,
+    ).model_dump_json(by_alias=True)
+
+    return "".join((_PROMPT_HEAD, input_json, _PROMPT_TAIL))
@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
-import json
 import logging
-from typing import Iterable, Sequence
+import re
+from typing import Any, Iterable, NamedTuple, Sequence
 
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 try:  # pragma: no cover - optional during unit tests without env deps
     from app.core.config import settings
 except Exception:  # pylint: disable=broad-except
     settings = None  # type: ignore[assignment]
-from app.schemas.decision import RuleEngineRequest, RuleEngineResponse, TipEntry
+from app.schemas.decision import (
+    DecisionSlot,
+    DutyFreeInfo,
+    ItineraryInfo,
+    RuleEngineRequest,
+    RuleEngineResponse,
+    SegmentInfo,
+    TipEntry,
+)
 try:  # pragma: no cover - optional dependency during unit tests
     from app.services.gemini_client import (
         GeminiCircuitOpenError,
@@ -33,6 +41,10 @@ _BANNED_SUBSTRINGS: tuple[str, ...] = (
     "fuck",
     "shit",
 )
+_LIQUID_KEYWORDS: tuple[str, ...] = ("액체", "액체류", "liquid", "100ml", "1l", "지퍼백")
+# 금칙어/액체 키워드를 각각 하나의 패턴으로 합쳐 팁마다 한 번만 스캔
+_BANNED_RE = re.compile("|".join(map(re.escape, _BANNED_SUBSTRINGS)))
+_LIQUID_KEYWORD_RE = re.compile("|".join(map(re.escape, _LIQUID_KEYWORDS)))
 
 _LIQUID_CANONICALS: set[str] = {
     "cosmetics_liquid",
@@ -47,15 +59,40 @@ _LIQUID_CANONICALS: set[str] = {
 
 
 class LLMTipEntry(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     text: str = Field(min_length=1, max_length=160)
     tags: list[str] = Field(default_factory=list)
     relevance: float = Field(default=0.7)
 
 
 class LLMTipPayload(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     tips: list[LLMTipEntry] = Field(default_factory=list)
 
 
+class _SanitizedTip(NamedTuple):
+    text: str
+    tags: list[str]
+    relevance: float
+
+
+class _TipsContext(BaseModel):
+    label: str
+    canonical: str
+    itinerary: ItineraryInfo
+    segments: list[SegmentInfo]
+    carry_on: DecisionSlot
+    checked: DecisionSlot
+    badges: dict[str, list[str]]
+    conditions: dict[str, Any]
+    duty_free: DutyFreeInfo
+    item_params: dict[str, Any]
+    locked_tip_ids: list[str]
+    hints: dict[str, bool]
+
+
 def fetch_llm_tips(
     request: RuleEngineRequest,
     response: RuleEngineResponse,
@@ -113,53 +150,18 @@ def fetch_llm_tips(
         return []
 
     sanitized = _sanitize_entries(payload.tips, hints)
-    tips: list[TipEntry] = []
-    for idx, entry in enumerate(sanitized[:limit]):
-        tips.append(
-            TipEntry(
-                id=f"tip.llm_{idx + 1}",
-                text=entry.text.strip(),
-                tags=entry.tags[:3],
-                relevance=_clamp(entry.relevance, 0.3, 0.95),
-            )
+    return [
+        TipEntry(
+            id=f"tip.llm_{idx + 1}",
+            text=entry.text,
+            tags=entry.tags,
+            relevance=_clamp(entry.relevance, 0.3, 0.95),
         )
-    return tips
+        for idx, entry in enumerate(sanitized[:limit])
+    ]
 
 
-def _build_prompt(
-    request: RuleEngineRequest,
-    response: RuleEngineResponse,
-    *,
-    label: str | None,
-    locale: str,
-    limit: int,
-    locked_tip_ids: Sequence[str],
-    hints: dict[str, bool],
-) -> str:
-    itinerary = request.itinerary.model_dump(by_alias=True)
-    decision = {
-        "carry_on": response.decision.carry_on.model_dump(),
-        "checked": response.decision.checked.model_dump(),
-    }
-    context = {
-        "label": label or request.canonical,
-        "canonical": request.canonical,
-        "itinerary": itinerary,
-        "segments": [segment.model_dump() for segment in request.segments],
-        "carry_on": decision["carry_on"],
-        "checked": decision["checked"],
-        "badges": {
-            "carry_on": response.decision.carry_on.badges,
-            "checked": response.decision.checked.badges,
-        },
-        "conditions": response.conditions,
-        "duty_free": request.duty_free.model_dump(),
-        "item_params": request.item_params.model_dump(exclude_none=True),
-        "locked_tip_ids": list(locked_tip_ids),
-        "hints": hints,
-    }
-    context_json = json.dumps(context, ensure_ascii=False, separators=(",", ":"))
-    return f"""
+_PROMPT_TEMPLATE = """
 System:
 You are an airline baggage assistant who writes short Korean travel tips.
 - Respond in the locale "{locale}" (fall back to Korean if unsure).
@@ -180,39 +182,67 @@ Task:
 Output JSON schema:
 {{"tips":[{{"text":"string","tags":["string"],"relevance":0.7}}]}}
 """
+_PROMPT_HEAD, _PROMPT_AFTER_LOCALE, _PROMPT_AFTER_CONTEXT, _PROMPT_TAIL = _PROMPT_TEMPLATE.format(
+    locale="\0",
+    context_json="\0",
+    limit="\0",
+).split("\0")
 
 
-def _sanitize_entries(entries: Iterable[LLMTipEntry], hints: dict[str, bool]) -> list[LLMTipEntry]:
-    def _violates_hints(text_lower: str, hints: dict[str, bool]) -> bool:
-        liquid_banned = not hints.get("is_liquid_item") and not hints.get("has_liquid_limits")
-        if liquid_banned and any(
-            keyword in text_lower for keyword in ("액체", "액체류", "liquid", "100ml", "1l", "지퍼백")
-        ):
-            return True
-        return False
+def _build_prompt(
+    request: RuleEngineRequest,
+    response: RuleEngineResponse,
+    *,
+    label: str | None,
+    locale: str,
+    limit: int,
+    locked_tip_ids: Sequence[str],
+    hints: dict[str, bool],
+) -> str:
+    decision = response.decision
+    # 이미 검증된 모델들이므로 model_construct로 재검증 없이 감싸 한 번에 직렬화
+    context_json = _TipsContext.model_construct(
+        label=label or request.canonical,
+        canonical=request.canonical,
+        itinerary=request.itinerary,
+        segments=request.segments,
+        carry_on=decision.carry_on,
+        checked=decision.checked,
+        badges={"carry_on": decision.carry_on.badges, "checked": decision.checked.badges},
+        conditions=response.conditions,
+        duty_free=request.duty_free,
+        item_params=request.item_params.model_dump(exclude_none=True),
+        locked_tip_ids=list(locked_tip_ids),
+        hints=hints,
+    ).model_dump_json(by_alias=True)
+    return "".join(
+        (_PROMPT_HEAD, locale, _PROMPT_AFTER_LOCALE, context_json, _PROMPT_AFTER_CONTEXT, str(limit), _PROMPT_TAIL)
+    )
+
 
-    sanitized: list[LLMTipEntry] = []
+def _sanitize_entries(entries: Iterable[LLMTipEntry], hints: dict[str, bool]) -> list[_SanitizedTip]:
+    liquid_banned = not hints.get("is_liquid_item") and not hints.get("has_liquid_limits")
+
+    # 검증된 팁을 다시 모델로 만들지 않고 최종 TipEntry 생성 시점까지 튜플로 유지
+    sanitized: list[_SanitizedTip] = []
     for entry in entries:
         text = entry.text.strip()
         if not text:
             continue
-        if any(banned in text.lower() for banned in _BANNED_SUBSTRINGS):
-            continue
         text_lower = text.lower()
-        if _violates_hints(text_lower, hints):
+        if _BANNED_RE.search(text_lower):
             continue
-        tags = [_clean_tag(tag) for tag in entry.tags[:3] if _clean_tag(tag)]
-        sanitized.append(
-            LLMTipEntry(text=text[:80], tags=tags, relevance=_clamp(entry.relevance, 0.0, 1.0))
-        )
+        if liquid_banned and _LIQUID_KEYWORD_RE.search(text_lower):
+            continue
+        tags: list[str] = []
+        for tag in entry.tags[:3]:
+            cleaned = tag.strip()
+            if cleaned:
+                tags.append(cleaned[:24])
+        sanitized.append(_SanitizedTip(text[:80].rstrip(), tags, _clamp(entry.relevance, 0.0, 1.0)))
     return sanitized
 
 
-def _clean_tag(tag: str) -> str:
-    cleaned = tag.strip()
-    return cleaned[:24] if cleaned else ""
-
-
 def _clamp(value: float, min_value: float, max_value: float) -> float:
     return max(min_value, min(max_value, value))
 
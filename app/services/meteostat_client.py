@@ -4,7 +4,10 @@ import logging
 from typing import Any
 from urllib.parse import urlparse
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from app.core.cache import cached_json
 from app.core.config import settings
@@ -13,32 +16,54 @@ from app.core.config import settings
 logger = logging.getLogger(__name__)
 
 
+def _build_default_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.1,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# 요청마다 클라이언트가 새로 만들어져도 TCP/TLS 연결은 프로세스 단위로 재사용한다.
+_DEFAULT_SESSION = _build_default_session()
+
+
 class MeteostatClient:
     def __init__(self, session: requests.Session | None = None) -> None:
-        self.session = session or requests.Session()
+        self.session = session or _DEFAULT_SESSION
         self.base_url = settings.meteostat_base_url.rstrip("/")
         self.timeout = settings.meteostat_timeout_sec
         self.api_key = settings.meteostat_api_key
         parsed = urlparse(self.base_url)
         self.host_header = parsed.netloc
+        self._headers = {
+            "x-rapidapi-key": self.api_key or "",
+            "x-rapidapi-host": self.host_header,
+        }
 
     def _request(self, path: str, params: dict[str, Any]) -> dict[str, Any]:
         if not self.api_key:
             raise RuntimeError("meteostat_api_key_missing")
 
-        headers = {
-            "x-rapidapi-key": self.api_key,
-            "x-rapidapi-host": self.host_header,
-        }
         try:
             resp = self.session.get(
                 f"{self.base_url}{path}",
                 params=params,
-                headers=headers,
+                headers=self._headers,
                 timeout=self.timeout,
             )
             resp.raise_for_status()
-            payload = resp.json()
+            payload = orjson.loads(resp.content)
         except requests.HTTPError as exc:
             status = exc.response.status_code if exc.response else "?"
             logger.warning("Meteostat HTTP error %s: %s", status, exc)
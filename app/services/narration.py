@@ -15,6 +15,26 @@ STATUS_LABELS = {
     "deny": "금지",
 }
 
+_LAYER_LABELS = {
+    "country_security": "보안",
+    "dangerous_goods": "위험물",
+    "airline": "항공사",
+    "international": "국제",
+}
+
+_ALLOW_REASON = "별도 제한 없이 허용됩니다."
+_STATUS_REASONS = {
+    "deny": "규정상 허용되지 않습니다.",
+    "allow": _ALLOW_REASON,
+}
+# limit 상태의 사유는 슬롯(기내/위탁)과 조건 종류로 결정된다
+_LIMIT_REASONS = {
+    "carry_lag": "100ml 이하 용기만 1L 지퍼백으로 반입",
+    "carry": "조건 충족 시 반입 가능",
+    "checked_md": "용기 500ml 이하, 총 2L, 압력캡 필요",
+    "checked": "위탁 가능(항공사·위험물 한도 내)",
+}
+
 
 def build_narration(
     preview: PreviewRequest,
@@ -25,10 +45,13 @@ def build_narration(
     checked = engine.decision.checked
     carry_conditions = engine.conditions.get("carry_on", {})
     checked_conditions = engine.conditions.get("checked", {})
+    # 조건 판정은 카드와 불릿에서 함께 쓰므로 한 번만 계산
+    carry_lag = _is_lag_condition(carry_conditions)
+    checked_md = _has_md_limits(checked_conditions)
     title = _title_for(classification, preview)
-    carry_card = _card_for(carry, carry_conditions)
-    checked_card = _card_for(checked, checked_conditions, checked=True)
-    bullets = _build_bullets(carry_conditions, checked_conditions, carry.badges)
+    carry_card = _card_for(carry, "carry_lag" if carry_lag else "carry")
+    checked_card = _card_for(checked, "checked_md" if checked_md else "checked")
+    bullets = _build_bullets(carry_lag, checked_md, checked_conditions, carry.badges)
     badges = sorted(set(carry.badges))
     sources = _summarize_sources(engine)
     footnote = "세관/검역 규정은 별도 적용될 수 있습니다."
@@ -51,22 +74,13 @@ def _title_for(classification: ClassificationResult, preview: PreviewRequest) ->
     return label
 
 
-def _card_for(slot: DecisionSlot, conditions: dict[str, object], *, checked: bool = False):
-    status_label = STATUS_LABELS.get(slot.status, slot.status)
-    if slot.status == "deny":
-        reason = "규정상 허용되지 않습니다."
-    elif slot.status == "limit":
-        if not checked and _is_lag_condition(conditions):
-            reason = "100ml 이하 용기만 1L 지퍼백으로 반입"
-        elif checked and _has_md_limits(conditions):
-            reason = "용기 500ml 이하, 총 2L, 압력캡 필요"
-        elif checked:
-            reason = "위탁 가능(항공사·위험물 한도 내)"
-        else:
-            reason = "조건 충족 시 반입 가능"
+def _card_for(slot: DecisionSlot, limit_reason_key: str):
+    status = slot.status
+    if status == "limit":
+        reason = _LIMIT_REASONS[limit_reason_key]
     else:
-        reason = "별도 제한 없이 허용됩니다."
-    return {"status_label": status_label, "short_reason": reason}
+        reason = _STATUS_REASONS.get(status, _ALLOW_REASON)
+    return {"status_label": STATUS_LABELS.get(status, status), "short_reason": reason}
 
 
 def _is_lag_condition(conditions: dict[str, object]) -> bool:
@@ -78,14 +92,15 @@ def _has_md_limits(conditions: dict[str, object]) -> bool:
 
 
 def _build_bullets(
-    carry_conditions: dict[str, object],
+    carry_lag: bool,
+    checked_md: bool,
     checked_conditions: dict[str, object],
     carry_badges: Iterable[str],
 ) -> list[str]:
     bullets: list[str] = []
-    if _is_lag_condition(carry_conditions):
+    if carry_lag:
         bullets.append("보안: 100ml 이하만, 1L 지퍼백 1개 필요")
-    if _has_md_limits(checked_conditions):
+    if checked_md:
         per_ml = int(checked_conditions.get("md_per_container_ml", 0))
         total_ml = int(checked_conditions.get("md_total_ml", 0))
         parts = []
@@ -101,19 +116,9 @@ def _build_bullets(
 
 
 def _summarize_sources(engine: RuleEngineResponse) -> list[str]:
-    entries: list[str] = []
-    for source in engine.sources[:3]:
-        label = _layer_label(source.layer)
-        entries.append(f"{label}/{source.code}")
-    return entries
+    return [f"{_layer_label(source.layer)}/{source.code}" for source in engine.sources[:3]]
 
 
 def _layer_label(layer: str) -> str:
-    mapping = {
-        "country_security": "보안",
-        "dangerous_goods": "위험물",
-        "airline": "항공사",
-        "international": "국제",
-    }
-    return mapping.get(layer, layer)
+    return _LAYER_LABELS.get(layer, layer)
 
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any, Dict
 
+import orjson
 from fastapi import HTTPException
 
 from app.core.config import settings
@@ -35,16 +35,18 @@ def generate_outfit_recommendation(payload: Dict[str, Any]) -> Dict[str, Any]:
         raise HTTPException(status_code=503, detail="llm_unavailable") from exc
 
     try:
-        data = json.loads(response_text)
-    except json.JSONDecodeError as exc:
+        data = orjson.loads(response_text)
+    except orjson.JSONDecodeError as exc:
         logger.warning("Gemini outfit recommendation invalid JSON: %s", exc)
         raise HTTPException(status_code=502, detail="llm_invalid_payload") from exc
     return data
 
 
+_PROMPT_PREFIX = f"{SYSTEM_PROMPT_RECOMMENDATION}\n\nInput:\n"
+
+
 def _build_prompt(payload: Dict[str, Any]) -> str:
-    body = json.dumps(payload, ensure_ascii=False)
-    return f"{SYSTEM_PROMPT_RECOMMENDATION}\n\nInput:\n{body}"
+    return _PROMPT_PREFIX + orjson.dumps(payload).decode()
 
 
 __all__ = ["generate_outfit_recommendation"]
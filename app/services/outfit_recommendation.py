@@ -113,15 +113,26 @@ class OutfitRecommendationService:
         return city, country
 
 
+# 월 -> 계절, 인덱스 = 월 (0은 사용하지 않음)
+_SEASONS = (
+    "winter",
+    "winter",
+    "winter",
+    "spring",
+    "spring",
+    "spring",
+    "summer",
+    "summer",
+    "summer",
+    "autumn",
+    "autumn",
+    "autumn",
+    "winter",
+)
+
+
 def _season_of(day: date) -> str:
-    month = day.month
-    if month in {12, 1, 2}:
-        return "winter"
-    if month in {3, 4, 5}:
-        return "spring"
-    if month in {6, 7, 8}:
-        return "summer"
-    return "autumn"
+    return _SEASONS[day.month]
 
 
 __all__ = ["OutfitRecommendationService"]
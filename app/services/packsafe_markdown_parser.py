@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
-import json
+import sys
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 
 PACKSAFE_MD_PATH = Path("docs/packsafe.md")
 
+# (경로, mtime_ns) -> 파싱 결과. 파일이 바뀌면 mtime이 달라져 자연히 다시 파싱된다.
+_PARSE_CACHE: dict[tuple[str, int], tuple[dict[str, Any], ...]] = {}
+
 
 def _normalize(text: str) -> str:
     return " ".join(text.split()) if text else ""
@@ -24,10 +29,26 @@ def _parse_bool(symbol: str) -> bool | None:
 
 
 def parse_packsafe_markdown(md_path: Path = PACKSAFE_MD_PATH) -> list[dict[str, Any]]:
-    if not md_path.exists():
-        raise FileNotFoundError(f"Markdown file not found: {md_path}")
+    """Parse the PackSafe table, reusing the previous parse while the file is unchanged.
+
+    Every call returns fresh rule dicts, so callers may mutate the result freely.
+    """
+    try:
+        mtime_ns = md_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Markdown file not found: {md_path}") from None
+
+    cache_key = (str(md_path.resolve()), mtime_ns)
+    cached = _PARSE_CACHE.get(cache_key)
+    if cached is None:
+        cached = tuple(_parse_lines(md_path.read_text(encoding="utf-8").splitlines()))
+        _PARSE_CACHE.clear()
+        _PARSE_CACHE[cache_key] = cached
+    # 규칙 값은 모두 불변(str/bool)이므로 두 단계 dict만 복사하면 깊은 복사와 같다
+    return [{**rule, "constraints": dict(rule["constraints"])} for rule in cached]
+
 
-    lines = md_path.read_text(encoding="utf-8").splitlines()
+def _parse_lines(lines: list[str]) -> list[dict[str, Any]]:
 
     rules: list[dict[str, Any]] = []
     for line in lines:
@@ -76,7 +97,8 @@ def build_packsafe_markdown_regulation(md_path: Path = PACKSAFE_MD_PATH) -> dict
 
 def main() -> None:
     data = build_packsafe_markdown_regulation()
-    print(json.dumps(data, ensure_ascii=False, indent=2))
+    sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date
 from typing import Any, Dict
@@ -21,6 +22,9 @@ from app.services.weather_client import WeatherClient
 
 logger = logging.getLogger(__name__)
 
+# 날씨/환율/통화명 조회는 서로 독립적인 HTTP 호출이므로 요청 간에 공유하는 풀에서 동시에 보낸다.
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="recommendation-io")
+
 COUNTRY_TO_CURRENCY: Dict[str, str] = {
     "KR": "KRW",
     "US": "USD",
@@ -57,8 +61,9 @@ class RecommendationService:
     def build(self, trip: Trip) -> TripRecommendationResponse:
         currency_code = self._currency_for_country(trip.country_code2)
         travel_window = self._window_label(trip.start_date, trip.end_date)
-        weather_raw = self.weather_client.fetch_current(trip.city, trip.country_code2)
+        weather_future = _IO_EXECUTOR.submit(self.weather_client.fetch_current, trip.city, trip.country_code2)
         exchange_raw = self._fetch_currency_rate(currency_code)
+        weather_raw = weather_future.result()
         sections = generate_recommendation_sections(
             RecommendationPromptContext(
                 city=trip.city,
@@ -126,22 +131,27 @@ class RecommendationService:
         Uses USD as intermediate base: fetch USD->currency and USD->KRW,
         then calculate currency->KRW = (USD->KRW) / (USD->currency)
         """
-        # Fetch both rates in one call if possible, or two separate calls
         target_upper = currency_code.upper()
 
-        # Get USD -> target currency rate
-        quote = self.fx_client.fetch_latest("USD", [target_upper])
+        # Currency names are fetched alongside the quote rather than after it
+        currencies_future = _IO_EXECUTOR.submit(self.fx_client.get_currencies)
+        # Get USD -> target and USD -> KRW rates in one call
+        quote = self.fx_client.fetch_latest("USD", [target_upper, "KRW"])
+        currencies = currencies_future.result()
+        return self._combine_currency_rate(target_upper, quote, currencies)
+
+    def _combine_currency_rate(
+        self,
+        target_upper: str,
+        quote: Dict[str, Any] | None,
+        currencies: Dict[str, str] | None,
+    ) -> Dict[str, Any] | None:
         if not quote or not quote.get("rates"):
             return None
         usd_to_target = quote["rates"].get(target_upper)
         if not usd_to_target:
             return None
-
-        # Get USD -> KRW rate
-        krw_quote = self.fx_client.fetch_latest("USD", ["KRW"])
-        if not krw_quote or not krw_quote.get("rates"):
-            return None
-        usd_to_krw = krw_quote["rates"].get("KRW")
+        usd_to_krw = quote["rates"].get("KRW")
         if not usd_to_krw:
             return None
 
@@ -150,7 +160,6 @@ class RecommendationService:
         krw_per_currency = usd_to_krw / usd_to_target
 
         # Get currency name from currencies list
-        currencies = self.fx_client.get_currencies()
         currency_name = currencies.get(target_upper, target_upper) if currencies else target_upper
 
         return {
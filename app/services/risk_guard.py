@@ -55,8 +55,9 @@ _REQUIRED_PARAM_MAP: dict[str, tuple[str, ...]] = {
     "camping_gas_canister": ("count",),
 }
 
-RISK_KEYS = set(get_risk_keys())
-BENIGN_KEYS = set(get_benign_keys())
+RISK_KEYS = frozenset(get_risk_keys())
+BENIGN_KEYS = frozenset(get_benign_keys())
+_ALLOWED_CANONICALS = RISK_KEYS | BENIGN_KEYS
 
 
 class LLMDecisionSlot(BaseModel):
@@ -104,9 +105,8 @@ class LLMDecisionPayload(BaseModel):
     @field_validator("canonical")
     @classmethod
     def validate_canonical(cls, value: str) -> str:
-        allowed = RISK_KEYS | BENIGN_KEYS
-        if value not in allowed:
-            raise ValueError(f"canonical must be one of {sorted(allowed)}")
+        if value not in _ALLOWED_CANONICALS:
+            raise ValueError(f"canonical must be one of {sorted(_ALLOWED_CANONICALS)}")
         return value
 
 class LLMResponseValidationError(RuntimeError):
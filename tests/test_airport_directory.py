@@ -21,7 +21,9 @@ from app.services.airport_directory import (
     AirportDirectoryService,
     AirportDirectorySynchronizer,
     CountryDirectoryService,
+    clear_local_directory_cache,
 )
+from app.services import airport_directory
 from app.services.airport_lookup import (
     reset_airport_directory_session_factory,
     set_airport_directory_session_factory,
@@ -70,10 +72,12 @@ def db_session(session_factory):
 @pytest.fixture(autouse=True)
 def override_airport_lookup_session(session_factory):
     set_airport_directory_session_factory(session_factory)
+    clear_local_directory_cache()
     try:
         yield
     finally:
         reset_airport_directory_session_factory()
+        clear_local_directory_cache()
 
 
 def _seed_directory(session: Session) -> None:
@@ -222,3 +226,80 @@ def test_trip_service_rejects_unknown_airport(db_session: Session):
     assert exc.value.detail["code"] == "airport_not_found"
 
 
+def test_airport_search_index_matches_partial_terms(db_session: Session):
+    _seed_directory(db_session)
+    service = AirportDirectoryService(db_session)
+
+    assert [a["iata_code"] for a in service.search(q="인천", active_only=False)] == ["ICN"]
+    assert [a["iata_code"] for a in service.search(q="k", country_code="kr", active_only=False)] == ["ICN"]
+    assert [a["iata_code"] for a in service.search(q="new york", active_only=False)] == ["JFK"]
+    assert service.search(q="international", limit=1, active_only=False)[0]["iata_code"] == "ICN"
+    assert service.search(q="zzz", active_only=False) == []
+    assert [a["iata_code"] for a in service.search(q="kennedy", country_code="us", active_only=False)] == ["JFK"]
+    assert service.search(q="kennedy", country_code="KR", active_only=False) == []
+
+
+def test_local_directory_cache_follows_version_and_returns_copies(db_session: Session, monkeypatch):
+    _seed_directory(db_session)
+    version = {"value": "1"}
+    monkeypatch.setattr(airport_directory, "read_directory_version", lambda: version["value"])
+    monkeypatch.setattr(airport_directory, "LOCAL_VERSION_CHECK_INTERVAL", 0.0)
+    service = AirportDirectoryService(db_session)
+
+    first = service.list(active_only=False)
+    first[0]["name_en"] = "mutated"
+    service.search(q="incheon", active_only=False)[0]["iata_code"] = "XXX"
+    assert service.list(active_only=False)[0]["name_en"] == "Incheon International Airport"
+    assert [a["iata_code"] for a in service.search(q="incheon", active_only=False)] == ["ICN"]
+
+    db_session.add(
+        Airport(
+            iata_code="GMP",
+            icao_code="RKSS",
+            name_en="Gimpo International Airport",
+            name_ko="김포국제공항",
+            city_en="Seoul",
+            country_code="KR",
+            region_group="아시아",
+        )
+    )
+    db_session.commit()
+    assert "GMP" not in {a["iata_code"] for a in service.list(active_only=False)}
+
+    version["value"] = "2"
+    assert "GMP" in {a["iata_code"] for a in service.list(active_only=False)}
+
+
+def test_synchronizer_upserts_and_prunes_directory(db_session: Session):
+    _seed_directory(db_session)
+    fake_rows = [
+        {
+            "공항코드1(IATA)": "ICN",
+            "공항코드2(ICAO)": "RKSI",
+            "영문공항명": "Seoul Incheon International Airport",
+            "영문국가명": "Korea",
+            "영문도시명": "Seoul",
+            "지역": "아시아",
+            "한글공항": "인천국제공항",
+            "한글국가명": "대한민국",
+        },
+        {
+            "공항코드1(IATA)": "GMP",
+            "공항코드2(ICAO)": "RKSS",
+            "영문공항명": "Gimpo International Airport",
+            "영문국가명": "Korea",
+            "영문도시명": "Seoul",
+            "지역": "아시아",
+            "한글공항": "김포국제공항",
+            "한글국가명": "대한민국",
+        },
+    ]
+
+    result = AirportDirectorySynchronizer(db_session, client=_FakeMolitClient(fake_rows)).run()
+
+    assert result.country_count == 1
+    assert result.airport_count == 2
+    airports = {a.iata_code: a for a in db_session.scalars(select(Airport)).all()}
+    assert set(airports) == {"ICN", "GMP"}
+    assert airports["ICN"].name_en == "Seoul Incheon International Airport"
+    assert {c.code for c in db_session.scalars(select(Country)).all()} == {"KR"}
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.base import Base
+from app.db.models.device_recovery_code import DeviceRecoveryCode
+from app.db.models.user import User
+from app.services.device_registry import DeviceRegistry, DeviceRegistryError
+
+
+@pytest.fixture()
+def db_session():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        future=True,
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine, future=True)()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(engine)
+        engine.dispose()
+
+
+def test_new_recovery_code_revokes_previous_active_codes(db_session: Session):
+    user = User(user_id=1, device_uuid="device-old")
+    other = User(user_id=2, device_uuid="device-other")
+    db_session.add_all([user, other])
+    db_session.commit()
+
+    registry = DeviceRegistry(db_session)
+    first = registry.generate_recovery_code(user)
+    registry.generate_recovery_code(other)
+    second = registry.generate_recovery_code(user)
+
+    codes = db_session.scalars(select(DeviceRecoveryCode).order_by(DeviceRecoveryCode.code_id)).all()
+    assert [(code.user_id, code.revoked_at is not None) for code in codes] == [
+        (1, True),
+        (2, False),
+        (1, False),
+    ]
+    assert second.code != first.code
+
+    with pytest.raises(DeviceRegistryError) as exc:
+        registry.redeem_recovery_code(first.code, {"device_uuid": "device-new"}, accept_language=None)
+    assert exc.value.code == "recovery_code_invalid"
@@ -41,3 +41,31 @@ def test_tampered_token_fails(monkeypatch):
 
     assert exc.value.code in {"token_malformed", "invalid_signature"}
 
+
+
+def test_signature_follows_current_secret(monkeypatch):
+    monkeypatch.setattr(device_tokens.time, "time", lambda: 1_000)
+    monkeypatch.setattr(device_tokens.settings, "guest_hmac_secret", "old-secret")
+    issued = issue_device_token(user_id=10, device_uuid="device-abc", ttl_seconds=60)
+    assert verify_device_token(issued.token)["uid"] == 10
+
+    monkeypatch.setattr(device_tokens.settings, "guest_hmac_secret", "new-secret")
+    with pytest.raises(DeviceTokenError) as exc:
+        verify_device_token(issued.token)
+
+    assert exc.value.code == "invalid_signature"
+
+
+def test_wrong_length_signature_is_rejected_before_hmac(monkeypatch):
+    monkeypatch.setattr(device_tokens.time, "time", lambda: 1_000)
+    issued = issue_device_token(user_id=10, device_uuid="device-abc", ttl_seconds=60)
+    payload_part, signature = issued.token.split(".")
+
+    def _fail_sign(message: bytes) -> bytes:
+        raise AssertionError("HMAC should not be computed for a wrong-length signature")
+
+    monkeypatch.setattr(device_tokens, "_sign", _fail_sign)
+    for bad_signature in (signature[:-1], signature + "A", ""):
+        with pytest.raises(DeviceTokenError) as exc:
+            verify_device_token(f"{payload_part}.{bad_signature}")
+        assert exc.value.code == "invalid_signature"
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.services.dict_classifier import RULES, _FUSED_RULES
+
+
+def _rule_literals() -> list[str]:
+    literals: list[str] = []
+    for pattern, _, _ in RULES:
+        literals.extend(pattern.pattern.strip("()").split("|"))
+    return literals
+
+
+def test_fused_rules_report_every_rule_matching_a_literal():
+    # 같은 위치에서 두 규칙이 매치되면 합친 패턴은 하나만 보고하므로, 규칙 단어가 겹치면 실패해야 한다.
+    for literal in _rule_literals():
+        expected = {idx for idx, (pattern, _, _) in enumerate(RULES) if pattern.search(literal)}
+        fused = {int(match.lastgroup[1:]) for match in _FUSED_RULES.finditer(literal)}
+        assert fused == expected, literal
+
+
+def test_fused_rules_find_rules_at_different_positions():
+    label = "dry ice spray with scissor"
+    fused = {int(match.lastgroup[1:]) for match in _FUSED_RULES.finditer(label)}
+    assert fused == {idx for idx, (pattern, _, _) in enumerate(RULES) if pattern.search(label)}
+    assert {RULES[idx][1] for idx in fused} == {"dry_ice", "aerosol", "knife"}
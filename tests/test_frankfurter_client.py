@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import threading
+import time
+from datetime import date
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+from app.services import frankfurter_client
+from app.services.frankfurter_client import FrankfurterClient
+
+
+class _FakeResponse:
+    def __init__(self, payload: dict):
+        self._payload = payload
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self) -> dict:
+        return self._payload
+
+
+class _SlowSession:
+    """첫 요청이 끝나기 전에 나머지 호출이 모두 대기열에 들어오도록 응답을 잡아 둔다."""
+
+    def __init__(self, release: threading.Event):
+        self.calls = 0
+        self._release = release
+        self._lock = threading.Lock()
+
+    def get(self, url: str, params: dict | None = None, timeout: float | None = None) -> _FakeResponse:
+        with self._lock:
+            self.calls += 1
+        self._release.wait(timeout=5)
+        return _FakeResponse({"date": "2025-01-02", "base": "USD", "rates": {"KRW": 1400.0, "JPY": 150.0}})
+
+
+@pytest.fixture(autouse=True)
+def isolate_fx_cache(monkeypatch):
+    # Redis 없이 loader를 바로 호출한다.
+    monkeypatch.setattr(frankfurter_client, "cached_json", lambda key, ttl, loader: loader())
+    frankfurter_client._LOCAL_RATES.clear()
+    frankfurter_client._LOCAL_HISTORICAL_RATES.clear()
+    frankfurter_client._LOCAL_CURRENCIES.clear()
+    try:
+        yield
+    finally:
+        frankfurter_client._LOCAL_RATES.clear()
+        frankfurter_client._LOCAL_HISTORICAL_RATES.clear()
+        frankfurter_client._LOCAL_CURRENCIES.clear()
+
+
+def test_concurrent_fetches_share_one_request():
+    release = threading.Event()
+    session = _SlowSession(release)
+    client = FrankfurterClient(session=session)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(client.fetch_latest, "USD", [symbol]) for symbol in ("KRW", "JPY") * 4]
+        while not frankfurter_client._INFLIGHT:
+            time.sleep(0.01)
+        # 나머지 호출들이 진행 중인 요청을 기다리는 상태가 되도록 잠시 둔다.
+        time.sleep(0.1)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert session.calls == 1
+    assert results[0]["rates"] == {"KRW": 1400.0}
+    assert results[1]["rates"] == {"JPY": 150.0}
+    assert frankfurter_client._INFLIGHT == {}
+
+
+def test_symbol_lookup_returns_none_for_unknown_symbol():
+    release = threading.Event()
+    release.set()
+    session = _SlowSession(release)
+    client = FrankfurterClient(session=session)
+
+    assert client.fetch_latest("USD", ["krw", "JPY"])["rates"] == {"KRW": 1400.0, "JPY": 150.0}
+    assert client.fetch_latest("USD", ["KRW", "XXX"]) is None
+    assert set(client.fetch_latest("USD")["rates"]) == {"KRW", "JPY"}
+    assert session.calls == 1
+
+    assert client.fetch_historical(date(2025, 1, 2), "USD", ["KRW"])["rates"] == {"KRW": 1400.0}
+    assert list(frankfurter_client._LOCAL_HISTORICAL_RATES) == ["fx:date:2025-01-02:USD:all"]
+    assert list(frankfurter_client._LOCAL_RATES) == ["fx:latest:USD:all"]
+
+
+def test_full_table_and_currencies_are_copies_of_the_cache():
+    release = threading.Event()
+    release.set()
+    client = FrankfurterClient(session=_SlowSession(release))
+
+    client.fetch_latest("USD")["rates"]["KRW"] = 0.0
+    assert client.fetch_latest("USD", ["KRW"])["rates"] == {"KRW": 1400.0}
+
+    class _CurrenciesSession:
+        def get(self, url: str, params: dict | None = None, timeout: float | None = None) -> _FakeResponse:
+            return _FakeResponse({"USD": "United States Dollar"})
+
+    client = FrankfurterClient(session=_CurrenciesSession())
+    client.get_currencies()["USD"] = "mutated"
+    client.get_currencies()["KRW"] = "mutated"
+    assert client.get_currencies() == {"USD": "United States Dollar"}
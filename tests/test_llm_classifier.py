@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import orjson
+import pytest
+
+from app.core.config import settings
+from app.services import llm_classifier
+from app.services.llm_classifier import LLMClassification, classify_with_llm
+
+
+_RESPONSE = orjson.dumps(
+    {
+        "categories": [{"key": "aerosol", "score": 0.9}],
+        "top": {"key": "aerosol", "score": 0.9},
+        "abstain": False,
+        "signals": {"matched_terms": ["spray"], "language": "en"},
+    }
+).decode()
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store: dict[str, bytes] = {}
+        self.ttls: dict[str, int] = {}
+
+    def get(self, key: str):
+        return self.store.get(key)
+
+    def setex(self, key: str, ttl: int, value: bytes) -> None:
+        self.store[key] = value
+        self.ttls[key] = ttl
+
+
+class _FakeGemini:
+    def __init__(self, response: str = _RESPONSE):
+        self.prompts: list[str] = []
+        self._response = response
+
+    def generate_json(self, prompt: str, **kwargs):
+        self.prompts.append(prompt)
+        return self._response, {"name": "fake"}
+
+
+@pytest.fixture()
+def fake_redis(monkeypatch):
+    redis = _FakeRedis()
+    monkeypatch.setattr(settings, "llm_classifier_enabled", True)
+    monkeypatch.setattr(settings, "gemini_api_key", "test-key")
+    monkeypatch.setattr(llm_classifier, "get_redis", lambda: redis)
+    monkeypatch.setattr(llm_classifier, "_L1_CACHE", llm_classifier._TTLCache(60, 16))
+    return redis
+
+
+def test_cached_label_skips_gemini_and_miss_is_stored(fake_redis, monkeypatch):
+    gemini = _FakeGemini()
+    monkeypatch.setattr(llm_classifier, "get_gemini_client", lambda: gemini)
+
+    cached = LLMClassification(
+        raw_label="hair spray",
+        norm_label="hair spray",
+        categories=[{"key": "aerosol", "score": 0.8}],
+        top={"key": "aerosol", "score": 0.8},
+        confidence=0.8,
+        abstain=False,
+        signals={"matched_terms": ["spray"]},
+        model_info={"name": "cached"},
+    )
+    hit_key = llm_classifier._build_cache_key("hair spray", "en")
+    fake_redis.store[hit_key] = orjson.dumps(cached)
+
+    assert classify_with_llm("hair spray", locale="en").model_info == {"name": "cached"}
+    assert gemini.prompts == []
+
+    result = classify_with_llm("deodorant spray", locale="en")
+    assert len(gemini.prompts) == 1
+    miss_key = llm_classifier._build_cache_key("deodorant spray", "en")
+    assert orjson.loads(fake_redis.store[miss_key])["raw_label"] == "deodorant spray"
+    assert fake_redis.ttls[miss_key] == llm_classifier._cache_ttl(result)
+
+    # 두 번째 호출은 L1에서 바로 돌려준다
+    assert classify_with_llm("deodorant spray", locale="en") is result
+    assert len(gemini.prompts) == 1
+
+
+def test_concurrent_misses_for_one_label_call_gemini_once(fake_redis, monkeypatch):
+    release = threading.Event()
+
+    class _BlockingGemini(_FakeGemini):
+        def generate_json(self, prompt: str, **kwargs):
+            release.wait(timeout=5)
+            return super().generate_json(prompt, **kwargs)
+
+    gemini = _BlockingGemini()
+    monkeypatch.setattr(llm_classifier, "get_gemini_client", lambda: gemini)
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        futures = [pool.submit(classify_with_llm, "hair spray", "en") for _ in range(6)]
+        while not llm_classifier._INFLIGHT:
+            time.sleep(0.01)
+        # 나머지 호출들이 진행 중인 분류를 기다리는 상태가 되도록 잠시 둔다.
+        time.sleep(0.1)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(gemini.prompts) == 1
+    assert all(result is results[0] for result in results)
+    assert llm_classifier._INFLIGHT == {}
+
+
+def test_abstaining_result_is_cached_with_negative_ttl(fake_redis, monkeypatch):
+    gemini = _FakeGemini(
+        orjson.dumps({"categories": [], "top": None, "abstain": True, "signals": {"matched_terms": []}}).decode()
+    )
+    monkeypatch.setattr(llm_classifier, "get_gemini_client", lambda: gemini)
+    monkeypatch.setattr(settings, "llm_classifier_negative_cache_ttl_seconds", 30)
+
+    result = classify_with_llm("asdf qwer", locale="en")
+
+    assert result.abstain is True
+    cache_key = llm_classifier._build_cache_key("asdf qwer", "en")
+    assert fake_redis.ttls[cache_key] == 30
+    assert classify_with_llm("asdf qwer", locale="en") is result
+    assert len(gemini.prompts) == 1